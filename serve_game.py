@@ -26,8 +26,7 @@ def list_games():
     sessions = []
     for session_dir in sorted(games_dir.iterdir(), reverse=True):
         if session_dir.is_dir() and not session_dir.name.startswith('.'):
-            session_json = session_dir / "session.json"
-            if session_json.exists():
+            if (session_dir / "session.json").exists() or (session_dir / "session.json.zst").exists():
                 sessions.append(session_dir.name)
     
     return sessions
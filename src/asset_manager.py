@@ -3,7 +3,9 @@ Asset pack management for game development.
 Handles asset discovery, file copying for build systems, and VLM-powered description management.
 """
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import xml.etree.ElementTree as ET
@@ -12,6 +14,24 @@ from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Copying is I/O bound, so more threads than cores is fine
+MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _copy_files(files: List[Path], dest_dir: Path) -> None:
+    """
+    Copy files into dest_dir concurrently (shutil.copy2 releases the GIL while copying).
+    
+    Args:
+        files: Source files to copy
+        dest_dir: Existing directory to copy them into
+    """
+    if not files:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(files))) as executor:
+        # list() re-raises the first copy error, like the sequential loop did
+        list(executor.map(lambda file: shutil.copy2(file, dest_dir / file.name), files))
+
 
 def list_available_packs(assets_dir: Path = Path("assets")) -> List[str]:
     """
@@ -116,11 +136,9 @@ Example good descriptions:
 - "Small brown rock obstacle for terrain decoration"
 """
     
-    # Load image
-    image = Image.open(image_path)
-    
-    # Call VLM
-    response = vlm_client.model.generate_content([prompt, image])
+    # Load image and call VLM (the image is closed as soon as the request is sent)
+    with Image.open(image_path) as image:
+        response = vlm_client.model.generate_content([prompt, image])
     description = response.text.strip()
     
     # Clean up description (remove quotes, newlines)
@@ -385,12 +403,13 @@ def prepare_pack_for_workspace(
     # Handle sprite assets from assets/PackName/
     sprite_pack_path = source_assets_dir / pack_name
     if sprite_pack_path.exists():
-        sprite_files = []
-        for file in sprite_pack_path.iterdir():
-            if file.is_file() and file.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
-                shutil.copy2(file, workspace_assets_dir / file.name)
-                sprite_files.append(file.name)
-                logger.info(f"Copied image asset: {file.name}")
+        sprite_paths = [
+            file for file in sprite_pack_path.iterdir()
+            if file.is_file() and file.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.webp']
+        ]
+        _copy_files(sprite_paths, workspace_assets_dir)
+        sprite_files = [file.name for file in sprite_paths]
+        logger.info(f"Copied {len(sprite_files)} image asset(s): {', '.join(sprite_files)}")
         
         # Get sprite descriptions and format for prompt
         sprite_desc_xml_path = sprite_pack_path / "description.xml"
@@ -403,12 +422,13 @@ def prepare_pack_for_workspace(
     # Handle sound assets from Sounds/PackName/
     sound_pack_path = source_sounds_dir / pack_name
     if sound_pack_path.exists():
-        sound_files = []
-        for file in sound_pack_path.iterdir():
-            if file.is_file() and file.suffix.lower() in ['.mp3', '.wav', '.ogg']:
-                shutil.copy2(file, workspace_assets_dir / file.name)
-                sound_files.append(file.name)
-                logger.info(f"Copied audio asset: {file.name}")
+        sound_paths = [
+            file for file in sound_pack_path.iterdir()
+            if file.is_file() and file.suffix.lower() in ['.mp3', '.wav', '.ogg']
+        ]
+        _copy_files(sound_paths, workspace_assets_dir)
+        sound_files = [file.name for file in sound_paths]
+        logger.info(f"Copied {len(sound_files)} audio asset(s): {', '.join(sound_files)}")
         
         # Get sound descriptions and format for prompt
         sound_desc_xml_path = sound_pack_path / "description.xml"
@@ -590,10 +610,8 @@ def prepare_sound_pack_for_workspace(
         logger.warning(f"No sound files found in pack {pack_name}")
         return None
     
-    for sound_file in sound_files:
-        dest_path = workspace_sounds_dir / sound_file.name
-        shutil.copy2(sound_file, dest_path)
-        logger.info(f"Copied sound file: {sound_file.name}")
+    _copy_files(sound_files, workspace_sounds_dir)
+    logger.info(f"Copied sound files: {', '.join(file.name for file in sound_files)}")
     
     logger.info(f"Prepared {len(sound_files)} sound files")
     
@@ -10,6 +10,12 @@ from .base_container import BaseContainer
 
 logger = logging.getLogger(__name__)
 
+# Where the playwright npm package is installed, kept apart from the game files in /app
+PLAYWRIGHT_MODULES_DIR = "/opt/playwright"
+
+# Where the built-in test runner scripts are baked into the base container
+TEST_SCRIPTS_DIR = "/opt/playwright/scripts"
+
 
 class PlaywrightContainer(BaseContainer):
     """
@@ -46,10 +52,24 @@ class PlaywrightContainer(BaseContainer):
         ctr = (
             client.container()
             .from_("mcr.microsoft.com/playwright:v1.49.0-jammy")
+            # Install playwright outside /app (pin exact version), so game files
+            # copied into /app - including a game's own package.json - never
+            # touch the cached npm install layer
+            .with_workdir(PLAYWRIGHT_MODULES_DIR)
+            .with_new_file(f"{PLAYWRIGHT_MODULES_DIR}/package.json", '{"dependencies": {"playwright": "1.49.0"}}')
+            # Keep npm's download cache across engine sessions, so rebuilding the
+            # npm install layer doesn't download playwright again
+            .with_mounted_cache("/root/.npm", client.cache_volume("playwright-npm"))
+            # The image already ships the matching browsers (PLAYWRIGHT_BROWSERS_PATH),
+            # so never let the install fetch them again
+            .with_env_variable("PLAYWRIGHT_SKIP_BROWSER_DOWNLOAD", "1")
+            .with_exec(["npm", "install", "--prefer-offline"], expect=ReturnType.ANY)
+            # Let require('playwright') in the test runner scripts resolve to that install
+            .with_env_variable("NODE_PATH", f"{PLAYWRIGHT_MODULES_DIR}/node_modules")
+            # The built-in test runners never change, so they go in the base
+            # layer once instead of being written on top of every game
+            .with_directory(TEST_SCRIPTS_DIR, cls._test_scripts_directory(client))
             .with_workdir("/app")
-            # Create package.json and install playwright locally (pin exact version)
-            .with_new_file("/app/package.json", '{"dependencies": {"playwright": "1.49.0"}}')
-            .with_exec(["npm", "install"], expect=ReturnType.ANY)
         )
         
         # Sync to ensure the container is ready
@@ -58,6 +78,17 @@ class PlaywrightContainer(BaseContainer):
         logger.info("PlaywrightContainer created successfully")
         return cls(client, ctr)
     
+    @staticmethod
+    def _test_scripts_directory(client: dagger.Client) -> Directory:
+        """Build a directory holding the built-in test runner scripts."""
+        # Imported here: test_game imports this module
+        from test_game import TEST_SCRIPT_FILES
+        
+        directory = client.directory()
+        for filename, script in TEST_SCRIPT_FILES.items():
+            directory = directory.with_new_file(filename, script)
+        return directory
+    
     @property
     def client(self) -> dagger.Client:
         """Get the Dagger client instance."""
@@ -70,13 +101,24 @@ class PlaywrightContainer(BaseContainer):
     def reset(self) -> Self:
         """
         Reset the container to clean state by clearing /app directory.
-        Keeps Playwright and node_modules but removes game files.
+        Keeps the Playwright install but removes game files.
         """
         # Reset to base container (with Playwright installed but no game files)
         self._ctr = self._base_ctr
         logger.debug("PlaywrightContainer reset to clean state")
         return self
     
+    def clone(self) -> Self:
+        """
+        Create an independent PlaywrightContainer sharing the same base container.
+        
+        Dagger containers are immutable, so the clone can be modified (reset,
+        copy files, add scripts) without affecting this instance.
+        """
+        cloned = type(self)(self._client, self._base_ctr)
+        cloned._ctr = self._ctr
+        return cloned
+    
     def copy_directory(self, source_dir: Directory, target_path: str = ".") -> Self:
         """
         Copy a directory into the container at /app.
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from anthropic import Anthropic
 from src.custom_types import Tool, ToolUse, TextRaw, ThinkingBlock, ContentBlock
@@ -148,10 +149,14 @@ class LLMClient:
         messages: list,
         tools: list[Tool],
         max_tokens: int = 8000,
-        system: str = None,
+        system: str | list[dict] = None,
         temperature: float = 1.0
     ):
-        """Call Claude with messages and tools."""
+        """Call Claude with messages and tools.
+
+        ``system`` may also be a list of Anthropic text blocks, which is sent
+        as-is so the caller controls where its cache breakpoints go.
+        """
         if system is None:
             raise ValueError("System prompt must be provided")
             
@@ -161,7 +166,9 @@ class LLMClient:
         # Add prompt caching to system prompt
         # System prompt is large and consistent, perfect for caching
         system_with_cache = None
-        if system:
+        if isinstance(system, list):
+            system_with_cache = system
+        elif system:
             system_with_cache = [
                 {
                     "type": "text",
@@ -223,4 +230,8 @@ class LLMClient:
         
         return response
 
+    async def acall(self, *args, **kwargs):
+        """Run :meth:`call` in a worker thread so several requests can overlap."""
+        return await asyncio.to_thread(self.call, *args, **kwargs)
+
 
@@ -38,6 +38,7 @@ from src.session import (
     Session,
     create_session,
     save_session,
+    append_iteration,
     load_session,
     list_sessions,
     get_game_path,
@@ -1171,9 +1172,11 @@ async def save_game_files(workspace: Workspace, session: Session, is_new: bool =
     # Update session metadata
     timestamp = datetime.now().isoformat()
     if feedback:
-        session.add_iteration(feedback, timestamp)
-    session.last_modified = timestamp
-    save_session(session, base_path=base_path)
+        # Cheap append; the full session file is rewritten when the workflow finishes
+        append_iteration(session, feedback, timestamp, base_path=base_path)
+    else:
+        session.last_modified = timestamp
+        save_session(session, base_path=base_path)
     
     logger.info(f"✅ Game saved successfully with {file_count} files")
 
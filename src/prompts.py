@@ -86,6 +86,10 @@ Implement this in your Game class and expose it globally:
        
        // MUST pause/freeze the game after loading
        this.pause();  // Or stop animations/timers/game loop
+       
+       // Signal the test runner once the loaded state is drawn
+       this.app.render();
+       (window as any).__testCaseReady = true;
      }}
      ```
   
@@ -97,6 +101,8 @@ Implement this in your Game class and expose it globally:
   - This function receives test case JSON data
   - It MUST pause/freeze the game after loading (stop animations, game loops, timers)
   - Make this function easy to remove for production (isolate the global exposure clearly)
+  - Set window.__testCaseReady = true once the loaded state is rendered, so the
+    test runner can take the screenshot without waiting a fixed delay
 
 Test Case Ordering (simple to complex):
   - test_case_1: Initial/start state (SIMPLEST)
@@ -463,6 +469,10 @@ export class Game {{
     
     // MUST pause/freeze the game after loading
     this.pause();
+    
+    // Signal the test runner once the loaded state is drawn
+    this.app.render();
+    (window as any).__testCaseReady = true;
   }}
 }}
 ```
@@ -493,6 +503,9 @@ sdk.init((width, height) => {{
   
   // Signal that resources are loaded and game is ready
   sdk.start();
+  
+  // Tell the test runner the game has initialized
+  (window as any).__gameReady = true;
 }});
 ```
 
@@ -1,15 +1,44 @@
 """
 Session management for game development projects.
 """
-import json
-import uuid
+import os
+import secrets
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import logging
 
+import orjson
+import zstandard
+
 logger = logging.getLogger(__name__)
 
+SESSION_FILE = "session.json"
+COMPRESSED_SESSION_FILE = "session.json.zst"
+ITERATIONS_LOG_FILE = "iterations.ndjson"
+
+# Sessions whose serialized metadata exceeds this size are stored zstd-compressed
+COMPRESSION_THRESHOLD = 64 * 1024
+
+# Number of threads used by list_sessions to read session files concurrently
+LIST_SESSIONS_WORKERS = 8
+
+
+def _intern_message_types(message_history: list[dict]) -> list[dict]:
+    """
+    Intern message "type" values so decoded histories share one string per type.
+    
+    Class names stored by set_message_history are already shared, but JSON
+    decoding creates a fresh "HumanMessage"/"AIMessage"/"ToolMessage" per message.
+    """
+    for msg_dict in message_history:
+        msg_type = msg_dict.get("type")
+        if isinstance(msg_type, str):
+            msg_dict["type"] = sys.intern(msg_type)
+    return message_history
+
 
 class Session:
     """Represents a game development session."""
@@ -68,7 +97,7 @@ class Session:
             created_at=data["created_at"],
             last_modified=data["last_modified"],
             iterations=data.get("iterations", []),
-            message_history=data.get("message_history", []),
+            message_history=_intern_message_types(data.get("message_history", [])),
             selected_pack=data.get("selected_pack"),
             status=data.get("status", "in_progress"),
             git_branch=data.get("git_branch"),
@@ -126,7 +155,8 @@ class Session:
         """Save essential graph state for recovery."""
         self.graph_state = {
             "retry_count": state.get("retry_count", 0),
-            "test_failures": state.get("test_failures", []),
+            # Own copy so later mutations of the graph state don't leak in
+            "test_failures": list(state.get("test_failures", [])),
             "is_completed": state.get("is_completed", False),
             "is_feedback_mode": state.get("is_feedback_mode", False),
             "original_prompt": state.get("original_prompt", ""),
@@ -135,7 +165,12 @@ class Session:
     
     def get_graph_state(self) -> dict:
         """Retrieve saved graph state."""
-        return self.graph_state.copy() if self.graph_state else {}
+        if not self.graph_state:
+            return {}
+        graph_state = self.graph_state.copy()
+        if "test_failures" in graph_state:
+            graph_state["test_failures"] = list(graph_state["test_failures"])
+        return graph_state
 
 
 def generate_session_id() -> str:
@@ -144,7 +179,7 @@ def generate_session_id() -> str:
     Format: YYYYMMDD_HHMMSS_<short_uuid>
     """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    short_uuid = str(uuid.uuid4())[:8]
+    short_uuid = secrets.token_hex(4)  # 8 random hex chars
     return f"{timestamp}_{short_uuid}"
 
 
@@ -175,25 +210,101 @@ def create_session(initial_prompt: str, base_path: Path = Path("games"), selecte
 
 
 def save_session(session: Session, base_path: Path = Path("games")):
-    """Save session metadata to JSON file."""
-    session_path = base_path / session.session_id / "session.json"
-    with open(session_path, "w", encoding="utf-8") as f:
-        json.dump(session.to_dict(), f, indent=2)
+    """
+    Save session metadata to JSON file.
+    
+    Large sessions (long message histories) are written as zstd-compressed
+    session.json.zst instead of plain session.json.
+    """
+    session_dir = base_path / session.session_id
+    payload = orjson.dumps(session.to_dict(), option=orjson.OPT_INDENT_2)
+    
+    if len(payload) > COMPRESSION_THRESHOLD:
+        session_path = session_dir / COMPRESSED_SESSION_FILE
+        stale_path = session_dir / SESSION_FILE
+        payload = zstandard.ZstdCompressor(level=3).compress(payload)
+    else:
+        session_path = session_dir / SESSION_FILE
+        stale_path = session_dir / COMPRESSED_SESSION_FILE
+    
+    # Write to a temp file and rename over the target so a crash mid-write
+    # never leaves a torn session file behind
+    tmp_path = session_path.with_name(session_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, session_path)
+    # Remove the other format so load_session never picks up an outdated copy
+    stale_path.unlink(missing_ok=True)
+    # Appended iterations are now part of the full snapshot
+    (session_dir / ITERATIONS_LOG_FILE).unlink(missing_ok=True)
     logger.info(f"Saved session metadata: {session.session_id}")
 
 
+def append_iteration(session: Session, feedback: str, timestamp: str, base_path: Path = Path("games")):
+    """
+    Record a feedback iteration without rewriting the whole session file.
+    
+    The iteration is added to the in-memory session and appended as one line to
+    iterations.ndjson; load_session replays the log and the next save_session
+    folds it back into the main session file.
+    """
+    session.add_iteration(feedback, timestamp)
+    log_path = base_path / session.session_id / ITERATIONS_LOG_FILE
+    with open(log_path, "ab") as f:
+        f.write(orjson.dumps(session.iterations[-1]) + b"\n")
+    logger.info(f"Appended iteration to session: {session.session_id}")
+
+
+def _replay_iterations(session: Session, log_path: Path):
+    """
+    Apply iterations appended since the last full save.
+    
+    Iterations already in the session are skipped: save_session replaces the
+    session file before it removes the log, so a crash in between leaves a
+    log whose entries are also in the snapshot.
+    """
+    if not log_path.exists():
+        return
+    
+    seen = {(it["timestamp"], it["feedback"]) for it in session.iterations}
+    with open(log_path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            iteration = orjson.loads(line)
+            key = (iteration["timestamp"], iteration["feedback"])
+            if key in seen:
+                continue
+            seen.add(key)
+            session.add_iteration(iteration["feedback"], iteration["timestamp"])
+
+
+def find_session_file(session_dir: Path) -> Optional[Path]:
+    """Return the session metadata file in a session directory, preferring the compressed one."""
+    for name in (COMPRESSED_SESSION_FILE, SESSION_FILE):
+        session_file = session_dir / name
+        if session_file.exists():
+            return session_file
+    return None
+
+
 def load_session(session_id: str, base_path: Path = Path("games")) -> Optional[Session]:
-    """Load session metadata from JSON file."""
-    session_path = base_path / session_id / "session.json"
+    """Load session metadata from JSON file (plain or zstd-compressed)."""
+    session_path = find_session_file(base_path / session_id)
     
-    if not session_path.exists():
-        logger.warning(f"Session file not found: {session_path}")
+    if session_path is None:
+        logger.warning(f"Session file not found: {base_path / session_id / SESSION_FILE}")
         return None
     
     try:
-        with open(session_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        payload = session_path.read_bytes()
+        if session_path.name == COMPRESSED_SESSION_FILE:
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        data = orjson.loads(payload)
         session = Session.from_dict(data)
+        _replay_iterations(session, base_path / session_id / ITERATIONS_LOG_FILE)
         logger.info(f"Loaded session: {session_id}")
         return session
     except Exception as e:
@@ -209,25 +320,39 @@ def list_sessions(base_path: Path = Path("games"), limit: int = 5) -> list[Sessi
     if not base_path.exists():
         return []
     
-    sessions = []
+    candidates = []
     
-    # Iterate through all directories in base_path
-    for session_dir in base_path.iterdir():
-        if not session_dir.is_dir():
-            continue
-        
-        session_file = session_dir / "session.json"
-        if not session_file.exists():
+    # Iterate through all directories in base_path; scandir answers is_dir()
+    # from the directory entry itself without an extra stat per entry
+    with os.scandir(base_path) as entries:
+        session_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+    
+    for session_dir in session_dirs:
+        session_file = find_session_file(session_dir)
+        if session_file is None:
             # Try to migrate old format (user_prompt.txt)
             old_prompt_file = session_dir / "user_prompt.txt"
             if old_prompt_file.exists():
                 logger.info(f"Found old format session: {session_dir.name}")
                 # Could migrate here, but for now just skip
-                continue
+            continue
         
-        session = load_session(session_dir.name, base_path)
-        if session:
-            sessions.append(session)
+        candidates.append(session_dir.name)
+    
+    # Directory names carry the timestamp prefix, so newest sessions come first.
+    # Load them in parallel batches (over-fetching in case some fail to parse)
+    # until we have enough sessions.
+    candidates.sort(reverse=True)
+    batch_size = max(limit * 2, 1)
+    sessions = []
+    
+    with ThreadPoolExecutor(max_workers=LIST_SESSIONS_WORKERS) as executor:
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            loaded = executor.map(lambda name: load_session(name, base_path), batch)
+            sessions.extend(session for session in loaded if session)
+            if len(sessions) >= limit:
+                break
     
     # Sort by session_id (which has timestamp prefix) in descending order
     sessions.sort(key=lambda s: s.session_id, reverse=True)
@@ -7,17 +7,25 @@ This module handles the validation of TypeScript builds including:
 - Copying critical files to dist/
 - Verifying HTML output
 """
+import fnmatch
 import logging
 from src.validators.base import ValidationResult
 
 logger = logging.getLogger(__name__)
 
+# Files that must be copied into dist/ alongside the built game
+CRITICAL_FILES = ("config.json", "MANIFEST.json")
+
+# Supported test case files, in execution order
+TEST_CASE_FILES = tuple(f"test_case_{i}.json" for i in range(1, 6))
+
 
 async def validate_build(workspace, retry_count: int = 0) -> ValidationResult:
     """
     Validate TypeScript build and type checking.
     
     This function performs the following steps:
+    0. Fail fast if there are no test case files (test_case_*.json)
     1. Run TypeScript type checker (npx tsc --noEmit)
     2. Run build process (npm run build)
     3. Copy config.json and MANIFEST.json to dist/
@@ -43,6 +51,28 @@ async def validate_build(workspace, retry_count: int = 0) -> ValidationResult:
     """
     logger.info("=== Build Validator - TypeScript Type Checking & Compilation ===")
     
+    # Step 0: Check test cases exist before spending time on type check and build
+    # Only list the workspace root - a find would walk node_modules
+    workspace_files = set(fnmatch.filter(await workspace.ls("."), "test_case_*.json"))
+    
+    # Test case files (1-5 test cases, flexible - copy only if they exist)
+    test_case_files = []
+    for test_file in TEST_CASE_FILES:
+        if test_file in workspace_files:
+            test_case_files.append(test_file)
+        else:
+            logger.debug("Skipping %s: not found in workspace", test_file)
+    
+    if not test_case_files:
+        error_msg = "❌ No test cases found\n\nYou must create at least 1 test case (test_case_1.json through test_case_5.json).\nTest cases are required to validate the game works correctly."
+        logger.error(error_msg)
+        return ValidationResult(
+            passed=False,
+            error_message=error_msg,
+            failures=["No test cases found"],
+            retry_count=retry_count + 1
+        )
+    
     # Step 1: Run TypeScript type checker
     logger.info("Step 1: Running TypeScript type check: npx tsc --noEmit")
     type_check_result = await workspace.exec(["npx", "tsc", "--noEmit"])
@@ -63,8 +93,8 @@ Common issues:
 
 Please review the errors above and fix the TypeScript code."""
         
-        logger.warning(f"Type check failed with exit code {type_check_result.exit_code}")
-        logger.warning(f"Type check output: {type_check_result.stdout[:500]}")
+        logger.warning("Type check failed with exit code %s", type_check_result.exit_code)
+        logger.warning("Type check output: %s", type_check_result.stdout[:500])
         
         return ValidationResult(
             passed=False,
@@ -94,8 +124,8 @@ Common issues:
 
 Please review the errors above and fix the code."""
         
-        logger.warning(f"Build failed with exit code {build_result.exit_code}")
-        logger.warning(f"Build stderr: {build_result.stderr}")
+        logger.warning("Build failed with exit code %s", build_result.exit_code)
+        logger.warning("Build stderr: %s", build_result.stderr)
         
         return ValidationResult(
             passed=False,
@@ -106,52 +136,34 @@ Please review the errors above and fix the code."""
     
     # Both type check and build succeeded
     logger.info("✅ Build successful")
-    logger.info(f"Build output: {build_result.stdout}")
+    logger.info("Build output: %s", build_result.stdout)
     
     # Copy config.json, MANIFEST.json, and test case files into dist/ for testing
     # This ensures the test container has access to these files
     logger.info("Copying config and test case files into dist/ for testing...")
     
-    # Get list of files in workspace root
-    workspace_files = await workspace.ls(".")
-    
-    # Copy critical files (must exist)
-    critical_files = ["config.json", "MANIFEST.json"]
-    for file_name in critical_files:
-        content = await workspace.read_file(file_name)
-        workspace = workspace.write_file(f"dist/{file_name}", content)
-        logger.info(f"Copied {file_name} to dist/")
-    
-    # Copy test case files (1-5 test cases, flexible - copy only if they exist)
-    test_cases_copied = 0
-    for i in range(1, 6):
-        test_file = f"test_case_{i}.json"
-        if test_file in workspace_files:
-            content = await workspace.read_file(test_file)
-            workspace = workspace.write_file(f"dist/{test_file}", content)
-            logger.info(f"Copied {test_file} to dist/")
-            test_cases_copied += 1
-        else:
-            logger.debug(f"Skipping {test_file}: not found in workspace")
-    
-    if test_cases_copied == 0:
-        error_msg = "❌ No test cases found\n\nYou must create at least 1 test case (test_case_1.json through test_case_5.json).\nTest cases are required to validate the game works correctly."
+    # Copy everything with one cp inside the container so file contents never
+    # leave it (and dist/ writes aren't subject to the agent's path restrictions)
+    files_to_copy = [*CRITICAL_FILES, *test_case_files]
+    copy_result = await workspace.exec_mut(["cp", *files_to_copy, "dist/"])
+    if copy_result.exit_code != 0:
+        error_msg = f"❌ Failed to copy files into dist/\n\n{copy_result.stderr}\n\nMake sure config.json and MANIFEST.json exist in the project root."
         logger.error(error_msg)
         return ValidationResult(
             passed=False,
             error_message=error_msg,
-            failures=["No test cases found"],
+            failures=[f"Failed to copy files into dist/: {copy_result.stderr[:200]}"],
             retry_count=retry_count + 1
         )
-    
-    logger.info(f"Copied {test_cases_copied} test case(s) to dist/")
+    logger.info("Copied %s to dist/", ", ".join(files_to_copy))
+    logger.info("Copied %d test case(s) to dist/", len(test_case_files))
     
     # Copy the built HTML to index.html for testing
     # playable-scripts creates a file like "Playable_Template_v1_..._Preview.html"
     # We need it accessible as index.html for testing
     logger.info("Creating index.html for testing...")
-    dist_files = await workspace.ls("dist")
-    html_files = [f for f in dist_files if f.endswith('.html')]
+    # Only list dist/ itself - a find over the workspace would walk node_modules
+    html_files = sorted(fnmatch.filter(await workspace.ls("dist"), "*.html"))
     
     # Build should produce exactly one HTML file
     if len(html_files) != 1:
@@ -165,9 +177,17 @@ Please review the errors above and fix the code."""
         )
     
     built_html = html_files[0]
-    logger.info(f"Found built HTML: {built_html}")
-    html_content = await workspace.read_file(f"dist/{built_html}")
-    workspace = workspace.write_file("dist/index.html", html_content)
+    logger.info("Found built HTML: %s", built_html)
+    index_result = await workspace.exec_mut(["cp", f"dist/{built_html}", "dist/index.html"])
+    if index_result.exit_code != 0:
+        error_msg = f"❌ Failed to create dist/index.html from dist/{built_html}\n\n{index_result.stderr}"
+        logger.error(error_msg)
+        return ValidationResult(
+            passed=False,
+            error_message=error_msg,
+            failures=[f"Failed to create dist/index.html: {index_result.stderr[:200]}"],
+            retry_count=retry_count + 1
+        )
     logger.info("Created dist/index.html for testing")
     
     # Return success with updated workspace
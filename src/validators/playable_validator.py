@@ -8,12 +8,22 @@ This module handles the validation of the main playable using VLM:
 """
 import logging
 from src.validators.base import ValidationResult
-from test_game import validate_game_in_workspace, TEST_SCRIPT
-from src.vlm import validate_playable_with_vlm, VLM_PLAYABLE_VALIDATION_PROMPT
+from test_game import validate_game_in_workspace
+from src.vlm import validate_playable_with_vlm, VLM_PLAYABLE_NORMAL_PROMPT, VLM_PLAYABLE_FEEDBACK_PROMPT
 from src.prompts import FEEDBACK_VALIDATION_FAILED
 
 logger = logging.getLogger(__name__)
 
+# FEEDBACK_VALIDATION_FAILED split around its placeholders once at import,
+# so rendering on each failed retry is a plain concatenation
+_FEEDBACK_PREFIX, _FEEDBACK_REST = FEEDBACK_VALIDATION_FAILED.split("{reason}")
+_FEEDBACK_MIDDLE, _FEEDBACK_SUFFIX = _FEEDBACK_REST.split("{console_logs}")
+
+
+def _render_validation_failed(reason: str, console_logs: str) -> str:
+    """Render FEEDBACK_VALIDATION_FAILED with the given reason and console logs."""
+    return _FEEDBACK_PREFIX + reason + _FEEDBACK_MIDDLE + console_logs + _FEEDBACK_SUFFIX
+
 
 async def validate_playable(
     workspace,
@@ -73,7 +83,7 @@ async def validate_playable(
     # Use built game from dist/ directory (after TypeScript compilation)
     playwright_container.copy_directory(
         workspace.container().directory("dist")
-    ).with_test_script(TEST_SCRIPT)
+    )
     
     # Run browser tests to get screenshot and console logs
     logger.info("Running browser tests on generated game...")
@@ -82,12 +92,12 @@ async def validate_playable(
     # Validate with VLM
     logger.info("Validating playable with VLM...")
     
-    is_valid, reason = validate_playable_with_vlm(
+    is_valid, reason = await validate_playable_with_vlm(
         vlm_client=vlm_client,
         screenshot_bytes=test_result.screenshot_bytes,
         console_logs=test_result.console_logs,
         user_prompt=task_description,
-        template_str=VLM_PLAYABLE_VALIDATION_PROMPT,
+        template_str=VLM_PLAYABLE_FEEDBACK_PROMPT if is_feedback_mode else VLM_PLAYABLE_NORMAL_PROMPT,
         session_id=session_id,
         is_feedback_mode=is_feedback_mode,
         original_prompt=original_prompt if is_feedback_mode else None,
@@ -95,7 +105,7 @@ async def validate_playable(
     )
     
     if not is_valid:
-        logger.warning(f"❌ VLM validation failed: {reason}")
+        logger.warning("❌ VLM validation failed: %s", reason)
         
         # Format console logs for feedback
         if test_result.console_logs:
@@ -104,10 +114,7 @@ async def validate_playable(
             console_logs_formatted = "  No console logs captured."
         
         # Create formatted error message for LLM with VLM reason and console logs
-        error_message = FEEDBACK_VALIDATION_FAILED.format(
-            reason=reason,
-            console_logs=console_logs_formatted
-        )
+        error_message = _render_validation_failed(reason, console_logs_formatted)
         
         return ValidationResult(
             passed=False,
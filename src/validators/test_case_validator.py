@@ -4,17 +4,36 @@ Test case validator for test case execution and VLM validation.
 This module handles the validation of test cases:
 - Discovers test case files (test_case_*.json)
 - Validates test case count and format
-- Executes each test case with Playwright
-- Validates test case results with VLM
+- Executes all test cases in one Playwright browser run
+- Validates test case results with a single batched VLM request
 """
+import asyncio
 import logging
-import json
+import orjson
+import re
+from typing import Optional
 from src.validators.base import ValidationResult
-from test_game import validate_game_with_test_case
-from src.vlm import validate_test_case_with_vlm, save_test_case_error, VLM_TEST_CASE_VALIDATION_PROMPT
+from test_game import validate_game_with_test_cases
+from src.vlm import validate_test_cases_with_vlm, save_test_case_error, VLM_TEST_CASE_VALIDATION_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Error message returned to the agent for a failing test case; {hint} says
+# what to fix for each kind of failure
+_TEST_CASE_FAILED = "Test case validation failed: {failure_msg}\n\nPlease {hint}."
+
+# Numbered test case file; the captured number gives the run order
+_TEST_CASE_FILE_RE = re.compile(r"test_case_(\d+)\.json$")
+
+
+def _test_case_sort_key(test_case_file: str) -> tuple:
+    """Sort key ordering test cases by number (test_case_2 before test_case_10)."""
+    match = _TEST_CASE_FILE_RE.search(test_case_file)
+    if match:
+        return 0, int(match.group(1)), test_case_file
+    # Files without a number (e.g. test_case_extra.json) go after numbered ones
+    return 1, 0, test_case_file
+
 
 async def validate_test_cases(
     workspace,
@@ -30,12 +49,14 @@ async def validate_test_cases(
     This function performs the following steps:
     1. Discover test case files (test_case_*.json) at root level
     2. Validate test case count (require 1-5)
-    3. For each test case in order (1 -> 5):
-       a. Read and parse test case JSON
-       b. Validate expectedOutput field exists
-       c. Run test case with Playwright
-       d. Validate result with VLM
-    4. Stop on first failure to save time
+    3. Read all test case files concurrently
+    4. Parse every test case and validate its expectedOutput field exists,
+       failing before any browser run if one is broken
+    5. Run all test cases in one browser run (one Chromium launch, test
+       cases run concurrently in separate browser contexts)
+    6. Report the earliest failing test case (1 -> 5) if a browser run failed
+    7. If all browser runs succeeded, validate all screenshots with a single
+       batched VLM request and report the earliest failing test case
     
     Args:
         workspace: The Dagger workspace container with the game
@@ -69,7 +90,7 @@ async def validate_test_cases(
     try:
         test_case_files = await workspace.list_files("test_case_*.json")
         # Sort test cases to ensure they run in order (1 -> 5)
-        test_case_files = sorted(test_case_files)
+        test_case_files = sorted(test_case_files, key=_test_case_sort_key)
         logger.info(f"Found {len(test_case_files)} test case files (sorted): {test_case_files}")
     except Exception as e:
         logger.error(f"Error discovering test case files: {e}")
@@ -90,141 +111,91 @@ async def validate_test_cases(
         logger.warning(f"Found {len(test_case_files)} test cases, but maximum is 5. Using first 5.")
         test_case_files = test_case_files[:5]
     
-    # Run each test case in order (1 -> 5)
-    # Stop on first failure to save time
-    for test_case_file in test_case_files:
-        test_case_name = test_case_file.split('/')[-1].replace('.json', '')
-        logger.info(f"Running test case: {test_case_name}")
-        
-        try:
-            # Read test case JSON from workspace
-            test_case_json = await workspace.read_file(test_case_file)
-            test_case_data = json.loads(test_case_json)
-            
-            # Extract expected output
-            expected_output = test_case_data.get("expectedOutput", "")
-            if not expected_output:
-                logger.warning(f"Test case {test_case_name} missing 'expectedOutput' field")
-                failure_msg = f"{test_case_name}: Missing 'expectedOutput' field in test case JSON"
-                
-                # Save test case error for debugging
-                save_test_case_error(
-                    test_case_name=test_case_name,
-                    expected_output="(missing)",
-                    actual_output="N/A - test case validation error",
-                    error_message=failure_msg,
-                    session_id=session_id,
-                    test_run_id=test_run_id
-                )
-                
-                # Return with error
-                error_msg = f"Test case validation failed: {failure_msg}\n\nPlease fix the test case and try again."
-                return ValidationResult(
-                    passed=False,
-                    error_message=error_msg,
-                    failures=[failure_msg],
-                    retry_count=retry_count + 1
-                )
-            
-            # Prepare fresh Playwright container for this test case
-            test_case_container = playwright_container
-            test_case_container.reset()
-            test_case_container.copy_directory(
-                workspace.container().directory(".")
-            )
-            
-            # Run test with test case loaded
-            test_case_result = await validate_game_with_test_case(
-                container=test_case_container,
-                test_case_json=test_case_json,
-                test_case_name=test_case_name
-            )
-            
-            # Check for errors in loading test case
-            if test_case_result.errors:
-                logger.warning(f"Test case {test_case_name} had errors: {test_case_result.errors}")
-                failure_msg = f"{test_case_name}: {', '.join(test_case_result.errors)}"
-                
-                # Save test case error for debugging
-                save_test_case_error(
-                    test_case_name=test_case_name,
-                    expected_output=expected_output,
-                    actual_output="N/A - test case loading error",
-                    error_message=failure_msg + "\n\nErrors:\n" + "\n".join(test_case_result.errors),
-                    session_id=session_id,
-                    test_run_id=test_run_id
-                )
-                
-                # Return with error
-                error_msg = f"Test case validation failed: {failure_msg}\n\nPlease fix the issues and try again."
-                return ValidationResult(
-                    passed=False,
-                    error_message=error_msg,
-                    failures=[failure_msg],
-                    retry_count=retry_count + 1
-                )
-            
-            # Validate with VLM
-            is_test_case_valid, test_case_reason = validate_test_case_with_vlm(
-                vlm_client=vlm_client,
-                screenshot_bytes=test_case_result.screenshot_bytes,
-                expected_output=expected_output,
-                template_str=VLM_TEST_CASE_VALIDATION_PROMPT,
-                test_case_name=test_case_name,
-                session_id=session_id,
-                test_case_json=test_case_json,
-                test_run_id=test_run_id
-            )
-            
-            if is_test_case_valid:
-                logger.info(f"✅ Test case {test_case_name} passed")
-                # Test case passed - continue to next test case
-            else:
-                logger.warning(f"❌ Test case {test_case_name} failed: {test_case_reason}")
-                failure_msg = f"{test_case_name} failed: Expected '{expected_output}' but VLM observed '{test_case_reason}'"
-                
-                # Save test case error for debugging
-                save_test_case_error(
-                    test_case_name=test_case_name,
-                    expected_output=expected_output,
-                    actual_output=test_case_reason,
-                    error_message=failure_msg,
-                    session_id=session_id,
-                    test_run_id=test_run_id
-                )
-                
-                # Return with error (stop executing other test cases)
-                logger.info(f"Test case retry attempt {retry_count + 1}/5")
-                error_msg = f"Test case validation failed: {failure_msg}\n\nPlease fix the issues and update the test case if needed."
-                return ValidationResult(
-                    passed=False,
-                    error_message=error_msg,
-                    failures=[failure_msg],
-                    retry_count=retry_count + 1
-                )
-                
-        except Exception as e:
-            logger.error(f"Error running test case {test_case_name}: {e}", exc_info=True)
-            failure_msg = f"{test_case_name}: Error running test case: {str(e)}"
-            
-            # Save test case error for debugging
-            save_test_case_error(
-                test_case_name=test_case_name,
-                expected_output=expected_output if 'expected_output' in locals() else "(unknown)",
-                actual_output="N/A - exception occurred",
-                error_message=failure_msg + f"\n\nException:\n{str(e)}",
-                session_id=session_id,
-                test_run_id=test_run_id
-            )
-            
-            # Return with error
-            error_msg = f"Test case validation failed: {failure_msg}\n\nPlease fix the error and try again."
-            return ValidationResult(
-                passed=False,
-                error_message=error_msg,
-                failures=[failure_msg],
-                retry_count=retry_count + 1
-            )
+    # Read all test case files at once - the reads are independent RPCs
+    test_case_contents = await asyncio.gather(
+        *(workspace.read_file(test_case_file) for test_case_file in test_case_files),
+        return_exceptions=True
+    )
+    
+    # Check every test case parses and has an expectedOutput before paying
+    # for any browser run; report the first broken one
+    expected_outputs: dict[str, str] = {}
+    for test_case_file, test_case_json in zip(test_case_files, test_case_contents):
+        failure, expected_output = await _load_test_case(
+            test_case_file=test_case_file,
+            test_case_json=test_case_json,
+            session_id=session_id,
+            test_run_id=test_run_id
+        )
+        if failure is not None:
+            return _failure_result(failure, retry_count)
+        expected_outputs[test_case_file] = expected_output
+    
+    # Copy the game into a Playwright container and run every test case in one
+    # browser run (one Node process, one Chromium, a context per test case)
+    game_container = (
+        playwright_container.clone()
+        .reset()
+        .copy_directory(workspace.container().directory("."))
+    )
+    logger.info(f"Running {len(test_case_files)} test case(s) in one browser run")
+    try:
+        test_case_results = await validate_game_with_test_cases(
+            container=game_container,
+            test_cases=[
+                (_test_case_name(test_case_file), test_case_json)
+                for test_case_file, test_case_json in zip(test_case_files, test_case_contents)
+            ]
+        )
+    except Exception as e:
+        # The run failed as a whole - report it against the first test case
+        first_file = test_case_files[0]
+        return _failure_result(
+            await _exception_failure(
+                _test_case_name(first_file), expected_outputs[first_file], e, session_id, test_run_id
+            ),
+            retry_count
+        )
+    
+    # Check the browser runs in order (1 -> 5), stopping at the first one that failed
+    browser_failure = None
+    vlm_cases: list[dict] = []
+    for test_case_file, test_case_json, test_case_result in zip(test_case_files, test_case_contents, test_case_results):
+        browser_failure, vlm_case = await _check_test_case_result(
+            test_case_file=test_case_file,
+            test_case_json=test_case_json,
+            expected_output=expected_outputs[test_case_file],
+            test_case_result=test_case_result,
+            session_id=session_id,
+            test_run_id=test_run_id
+        )
+        if browser_failure is not None:
+            break
+        vlm_cases.append(vlm_case)
+    
+    # Validate the screenshots of every test case before the first browser
+    # failure with one batched VLM request - an earlier VLM rejection is the
+    # earliest failure, so it is reported instead of the browser failure
+    failure = None
+    if vlm_cases:
+        vlm_results = await validate_test_cases_with_vlm(
+            vlm_client=vlm_client,
+            test_cases=vlm_cases,
+            template_str=VLM_TEST_CASE_VALIDATION_PROMPT,
+            session_id=session_id,
+            test_run_id=test_run_id
+        )
+        for test_case, (is_valid, reason) in zip(vlm_cases, vlm_results):
+            if is_valid:
+                logger.info(f"✅ Test case {test_case['test_case_name']} passed")
+            elif failure is None:
+                # Only the earliest failing test case is reported
+                failure = await _vlm_failure(test_case, reason, session_id, test_run_id)
+    if failure is None:
+        failure = browser_failure
+    
+    if failure is not None:
+        return _failure_result(failure, retry_count)
     
     # All tests passed!
     logger.info("✅ All test cases passed! Game is fully validated.")
@@ -236,3 +207,164 @@ async def validate_test_cases(
         retry_count=0  # Reset retry count on success
     )
 
+
+def _failure_result(failure: tuple[str, str], retry_count: int) -> ValidationResult:
+    """Build the failed ValidationResult for a (failure_msg, error_msg) pair."""
+    failure_msg, error_msg = failure
+    logger.info(f"Test case retry attempt {retry_count + 1}/5")
+    return ValidationResult(
+        passed=False,
+        error_message=error_msg,
+        failures=[failure_msg],
+        retry_count=retry_count + 1
+    )
+
+
+def _test_case_name(test_case_file: str) -> str:
+    """Return the test case name (e.g. "test_case_1") for a test case file path."""
+    return test_case_file.split('/')[-1].replace('.json', '')
+
+
+async def _load_test_case(
+    test_case_file: str,
+    test_case_json: str | BaseException,
+    session_id: str,
+    test_run_id: str
+) -> tuple[Optional[tuple[str, str]], Optional[str]]:
+    """
+    Parse a test case and check it has an expectedOutput, without running it.
+    
+    test_case_json is the file content, or the exception raised reading it.
+    
+    Returns:
+        Tuple of (failure, expected_output) where exactly one is set:
+        failure is (failure_msg, error_msg) if the test case is broken
+    """
+    test_case_name = _test_case_name(test_case_file)
+    
+    try:
+        # Report a failed read like any other error running the test case
+        if isinstance(test_case_json, BaseException):
+            raise test_case_json
+        test_case_data = orjson.loads(test_case_json)
+        if not isinstance(test_case_data, dict):
+            raise TypeError("test case JSON must be an object")
+    except Exception as e:
+        return await _exception_failure(test_case_name, "(unknown)", e, session_id, test_run_id), None
+    
+    # Extract expected output
+    expected_output = test_case_data.get("expectedOutput", "")
+    if not expected_output:
+        logger.warning(f"Test case {test_case_name} missing 'expectedOutput' field")
+        failure_msg = f"{test_case_name}: Missing 'expectedOutput' field in test case JSON"
+        
+        # Save test case error for debugging
+        await asyncio.to_thread(
+            save_test_case_error,
+            test_case_name=test_case_name,
+            expected_output="(missing)",
+            actual_output="N/A - test case validation error",
+            error_message=failure_msg,
+            session_id=session_id,
+            test_run_id=test_run_id
+        )
+        
+        error_msg = _TEST_CASE_FAILED.format(failure_msg=failure_msg, hint="fix the test case and try again")
+        return (failure_msg, error_msg), None
+    
+    return None, expected_output
+
+
+async def _check_test_case_result(
+    test_case_file: str,
+    test_case_json: str,
+    expected_output: str,
+    test_case_result,
+    session_id: str,
+    test_run_id: str
+) -> tuple[Optional[tuple[str, str]], Optional[dict]]:
+    """
+    Check the browser run result of a single (already loaded) test case.
+    
+    Returns:
+        Tuple of (failure, vlm_case) where exactly one is set:
+        failure is (failure_msg, error_msg) if the test case failed before VLM
+        validation, vlm_case holds the arguments for validate_test_cases_with_vlm
+    """
+    test_case_name = _test_case_name(test_case_file)
+    
+    # Check for errors in loading test case
+    if test_case_result.errors:
+        logger.warning(f"Test case {test_case_name} had errors: {test_case_result.errors}")
+        failure_msg = f"{test_case_name}: {', '.join(test_case_result.errors)}"
+        
+        # Save test case error for debugging
+        await asyncio.to_thread(
+            save_test_case_error,
+            test_case_name=test_case_name,
+            expected_output=expected_output,
+            actual_output="N/A - test case loading error",
+            error_message=failure_msg + "\n\nErrors:\n" + "\n".join(test_case_result.errors),
+            session_id=session_id,
+            test_run_id=test_run_id
+        )
+        
+        error_msg = _TEST_CASE_FAILED.format(failure_msg=failure_msg, hint="fix the issues and try again")
+        return (failure_msg, error_msg), None
+    
+    # Browser run succeeded - the screenshot is validated with VLM later,
+    # together with the other test cases
+    return None, {
+        "screenshot_bytes": test_case_result.screenshot_bytes,
+        "expected_output": expected_output,
+        "test_case_name": test_case_name,
+        "test_case_json": test_case_json
+    }
+
+
+async def _exception_failure(
+    test_case_name: str,
+    expected_output: str,
+    error: Exception,
+    session_id: str,
+    test_run_id: str
+) -> tuple[str, str]:
+    """Build (failure_msg, error_msg) for an exception while loading or running a test case."""
+    logger.error(f"Error running test case {test_case_name}: {error}", exc_info=error)
+    failure_msg = f"{test_case_name}: Error running test case: {str(error)}"
+    
+    # Save test case error for debugging
+    await asyncio.to_thread(
+        save_test_case_error,
+        test_case_name=test_case_name,
+        expected_output=expected_output,
+        actual_output="N/A - exception occurred",
+        error_message=failure_msg + f"\n\nException:\n{str(error)}",
+        session_id=session_id,
+        test_run_id=test_run_id
+    )
+    
+    return failure_msg, _TEST_CASE_FAILED.format(failure_msg=failure_msg, hint="fix the error and try again")
+
+
+async def _vlm_failure(test_case: dict, reason: str, session_id: str, test_run_id: str) -> tuple[str, str]:
+    """Build (failure_msg, error_msg) for a test case rejected by VLM and save it for debugging."""
+    test_case_name = test_case["test_case_name"]
+    expected_output = test_case["expected_output"]
+    
+    logger.warning(f"❌ Test case {test_case_name} failed: {reason}")
+    failure_msg = f"{test_case_name} failed: Expected '{expected_output}' but VLM observed '{reason}'"
+    
+    # Save test case error for debugging
+    await asyncio.to_thread(
+        save_test_case_error,
+        test_case_name=test_case_name,
+        expected_output=expected_output,
+        actual_output=reason,
+        error_message=failure_msg,
+        session_id=session_id,
+        test_run_id=test_run_id
+    )
+    
+    error_msg = _TEST_CASE_FAILED.format(failure_msg=failure_msg, hint="fix the issues and update the test case if needed")
+    return failure_msg, error_msg
@@ -11,10 +11,13 @@ from src.vlm.client import VLMClient
 from src.vlm.validation import (
     validate_playable_with_vlm,
     validate_test_case_with_vlm,
+    validate_test_cases_with_vlm,
     save_test_case_error
 )
 from src.vlm.prompts import (
     VLM_PLAYABLE_VALIDATION_PROMPT,
+    VLM_PLAYABLE_NORMAL_PROMPT,
+    VLM_PLAYABLE_FEEDBACK_PROMPT,
     VLM_TEST_CASE_VALIDATION_PROMPT
 )
 
@@ -22,8 +25,11 @@ __all__ = [
     'VLMClient',
     'validate_playable_with_vlm',
     'validate_test_case_with_vlm',
+    'validate_test_cases_with_vlm',
     'save_test_case_error',
     'VLM_PLAYABLE_VALIDATION_PROMPT',
+    'VLM_PLAYABLE_NORMAL_PROMPT',
+    'VLM_PLAYABLE_FEEDBACK_PROMPT',
     'VLM_TEST_CASE_VALIDATION_PROMPT',
 ]
 
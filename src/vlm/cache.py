@@ -0,0 +1,81 @@
+"""
+In-process cache for VLM responses.
+
+Responses are keyed on (screenshot hash, rendered prompt hash), so submitting an
+identical screenshot with an identical prompt again - e.g. unchanged test cases
+on a retry iteration - returns the previous answer instead of calling Gemini.
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Test case prompts only depend on the screenshot and the expected output, so
+# their answers stay valid for a long time. Playable validation answers are
+# kept for a shorter time.
+TEST_CASE_CACHE_TTL = 24 * 60 * 60
+PLAYABLE_CACHE_TTL = 60 * 60
+
+# Upper bound on cached responses (oldest entries are evicted first)
+MAX_CACHE_ENTRIES = 256
+
+_cache: dict[str, tuple[float, str]] = {}
+# VLM helpers may be called from worker threads
+_lock = threading.Lock()
+
+
+def cache_key(screenshot_bytes: bytes, prompt: str) -> str:
+    """Return the cache key for a screenshot and rendered prompt."""
+    image_hash = hashlib.blake2b(screenshot_bytes, digest_size=16).hexdigest()
+    prompt_hash = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+    return image_hash + prompt_hash
+
+
+def get_cached_response(screenshot_bytes: bytes, prompt: str) -> Optional[str]:
+    """Return the cached response text, or None on a miss or expired entry."""
+    key = cache_key(screenshot_bytes, prompt)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires_at, response_text = entry
+        if expires_at <= time.monotonic():
+            del _cache[key]
+            return None
+    logger.info(f"VLM cache HIT ({key[:12]})")
+    return response_text
+
+
+def has_verdict(response_text: str) -> bool:
+    """Return True if the response contains a yes/no <answer> tag.
+
+    Malformed replies are not cached, so a retry asks the model again instead
+    of getting the same unparseable answer back for the whole TTL.
+    """
+    lowered = response_text.lower()
+    start = lowered.find("<answer>")
+    if start == -1:
+        return False
+    start += len("<answer>")
+    end = lowered.find("</answer>", start)
+    return end != -1 and lowered[start:end].strip() in ("yes", "no")
+
+
+def cache_response(screenshot_bytes: bytes, prompt: str, response_text: str, ttl: float):
+    """Store a response text for ttl seconds."""
+    key = cache_key(screenshot_bytes, prompt)
+    with _lock:
+        _cache.pop(key, None)
+        _cache[key] = (time.monotonic() + ttl, response_text)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del _cache[next(iter(_cache))]
+
+
+def clear_cache():
+    """Drop all cached responses."""
+    with _lock:
+        _cache.clear()
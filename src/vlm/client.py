@@ -3,17 +3,101 @@ VLM Client for interacting with Gemini Vision Language Model.
 """
 import os
 import io
+import re
+import struct
 import logging
-from PIL import Image
-from jinja2 import Template
+from functools import lru_cache
+from jinja2 import Environment, Template
 import google.generativeai as genai
 from dotenv import load_dotenv
 import logfire
+from src.vlm.prompts import VLM_BATCH_VALIDATION_HEADER, VLM_BATCH_VALIDATION_FOOTER
+from src.vlm.cache import get_cached_response, cache_response, has_verdict, PLAYABLE_CACHE_TTL
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# API key genai is currently configured with. genai.configure() throws away the
+# SDK's cached API clients and their open connections, so VLMClient instances
+# only reconfigure when the key changes and otherwise reuse the warm channels.
+_configured_api_key: str | None = None
+
+# Screenshots larger than this (longest side, in pixels) are downscaled before
+# being sent to Gemini - the VLM doesn't need full resolution to check a game state.
+# Override with PLAYABLE_VLM_MAX_SIDE.
+MAX_IMAGE_SIDE = int(os.environ.get("PLAYABLE_VLM_MAX_SIDE", "768"))
+
+# Shared Jinja2 environment for the VLM prompt templates
+_env = Environment(cache_size=32, autoescape=False)
+
+
+@lru_cache(maxsize=32)
+def get_template(template_str: str) -> Template:
+    """
+    Compile a prompt template once and reuse it for later calls.
+    
+    Environment.from_string always recompiles, so compiled templates are
+    cached here by their source string.
+    """
+    return _env.from_string(template_str)
+
+
+@lru_cache(maxsize=128)
+def _render_cached(template_str: str, context: tuple) -> str:
+    return get_template(template_str).render(dict(context))
+
+
+def render_prompt(template_str: str, **context) -> str:
+    """
+    Render a prompt template.
+    
+    Retries render the same template with the same values, so rendered
+    prompts are cached by (template, context). Context values must be hashable.
+    """
+    return _render_cached(template_str, tuple(sorted(context.items())))
+
+
+# One <result id="N">...</result> block per case in a batch response
+_BATCH_RESULT_RE = re.compile(r'<result id="(\d+)">(.*?)</result>', re.DOTALL)
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_size(screenshot_bytes: bytes) -> tuple[int, int] | None:
+    """Read (width, height) from the PNG IHDR chunk, or None if the bytes aren't a PNG."""
+    if len(screenshot_bytes) < 24 or not screenshot_bytes.startswith(_PNG_SIGNATURE):
+        return None
+    return struct.unpack(">II", screenshot_bytes[16:24])
+
+
+def image_part(screenshot_bytes: bytes) -> dict:
+    """
+    Wrap a PNG screenshot as an inline image part for generate_content.
+    
+    Screenshots within MAX_IMAGE_SIDE are passed through as the original bytes
+    object (no copy, no PIL). Larger ones are downscaled and re-encoded as WebP
+    to cut upload size and image token cost.
+    """
+    size = _png_size(screenshot_bytes)
+    if size is not None and max(size) <= MAX_IMAGE_SIDE:
+        return {"mime_type": "image/png", "data": screenshot_bytes}
+    
+    # PIL is only needed for downscaling, so it isn't imported with the module
+    from PIL import Image
+    
+    # Close the decoded image right away so PIL frees its pixel storage
+    # instead of holding it until garbage collection
+    with Image.open(io.BytesIO(screenshot_bytes)) as image:
+        if max(image.size) <= MAX_IMAGE_SIDE:
+            return {"mime_type": "image/png", "data": screenshot_bytes}
+        
+        image.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.LANCZOS)
+        buffer = io.BytesIO()
+        image.save(buffer, "WEBP", quality=85)
+    return {"mime_type": "image/webp", "data": buffer.getvalue()}
+
 
 class VLMClient:
     """Client for interacting with Gemini Vision Language Model."""
@@ -23,8 +107,11 @@ class VLMClient:
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not found in environment")
         
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
+        # Configure Gemini (once per API key, see _configured_api_key)
+        global _configured_api_key
+        if _configured_api_key != self.api_key:
+            genai.configure(api_key=self.api_key)
+            _configured_api_key = self.api_key
         
         # Use model from: parameter > LLM_VISION_MODEL env > default
         self.model_name = (os.environ.get("LLM_VISION_MODEL"))
@@ -32,7 +119,7 @@ class VLMClient:
         self.model = genai.GenerativeModel(self.model_name)
         logger.info(f"Initialized VLMClient with model: {self.model_name}")
     
-    def validate_with_screenshot(
+    async def validate_with_screenshot(
         self, 
         screenshot_bytes: bytes, 
         console_logs: str,
@@ -52,12 +139,17 @@ class VLMClient:
             Raw response text from Gemini containing <answer> and <reason> tags
         """
         # Render the prompt template with Jinja2
-        template = Template(template_str)
-        rendered_prompt = template.render(
+        rendered_prompt = render_prompt(
+            template_str,
             user_prompt=user_prompt,
             console_logs=console_logs
         )
         
+        # Same screenshot and prompt as a recent call - reuse its answer
+        cached_response = get_cached_response(screenshot_bytes, rendered_prompt)
+        if cached_response is not None:
+            return cached_response
+        
         logger.info(f"Validating with VLM using model: {self.model_name}")
         logger.debug(f"Rendered prompt: {rendered_prompt[:200]}...")
         
@@ -69,11 +161,10 @@ class VLMClient:
             prompt_length=len(rendered_prompt),
             has_console_logs=bool(console_logs)
         ) as span:
-            # Convert bytes to PIL Image
-            image = Image.open(io.BytesIO(screenshot_bytes))
-            
             # Generate content with image and prompt
-            response = self.model.generate_content([rendered_prompt, image])
+            response = await self.model.generate_content_async([rendered_prompt, image_part(screenshot_bytes)])
+            
+            span_attributes = {"response_length": len(response.text)}
             
             # Add token usage to span attributes
             if hasattr(response, 'usage_metadata') and response.usage_metadata:
@@ -89,17 +180,65 @@ class VLMClient:
                     f"Total: {usage_metadata.total_token_count}"
                 )
                 
-                # Add to span attributes
-                span.set_attribute("input_tokens", usage_metadata.prompt_token_count)
-                span.set_attribute("output_tokens", usage_metadata.candidates_token_count)
-                span.set_attribute("total_tokens", usage_metadata.total_token_count)
-                span.set_attribute("cached_tokens", getattr(usage_metadata, 'cached_content_token_count', 0))
+                span_attributes.update({
+                    "input_tokens": usage_metadata.prompt_token_count,
+                    "output_tokens": usage_metadata.candidates_token_count,
+                    "total_tokens": usage_metadata.total_token_count,
+                    "cached_tokens": getattr(usage_metadata, 'cached_content_token_count', 0),
+                })
             
-            # Add response length to span
-            span.set_attribute("response_length", len(response.text))
+            # Set all span attributes in one call
+            span.set_attributes(span_attributes)
             
             logger.info("VLM validation response received")
             logger.debug(f"VLM response: {response.text[:200]}...")
             
+            if has_verdict(response.text):
+                cache_response(screenshot_bytes, rendered_prompt, response.text, PLAYABLE_CACHE_TTL)
             return response.text
 
+    
+    async def validate_batch(self, screenshots: list[bytes], prompts: list[str]) -> list[str]:
+        """
+        Validate several screenshots in a single Gemini request.
+        
+        Args:
+            screenshots: PNG screenshot bytes, one per case
+            prompts: Rendered validation prompts, one per case (same order)
+        
+        Returns:
+            Raw response text for each case, in the same order as the inputs
+        
+        Raises:
+            ValueError: If the response doesn't contain exactly one result per case
+        """
+        if len(screenshots) != len(prompts):
+            raise ValueError("screenshots and prompts must have the same length")
+        
+        contents = [VLM_BATCH_VALIDATION_HEADER.format(count=len(prompts))]
+        for case_id, (prompt, screenshot_bytes) in enumerate(zip(prompts, screenshots), start=1):
+            contents.append(f'<test_case id="{case_id}">\n{prompt}')
+            contents.append(image_part(screenshot_bytes))
+            contents.append("</test_case>")
+        contents.append(VLM_BATCH_VALIDATION_FOOTER)
+        
+        logger.info(f"Validating {len(prompts)} case(s) with VLM in one request using model: {self.model_name}")
+        
+        with logfire.span(
+            f"Google Vision API batch ({self.model_name})",
+            model=self.model_name,
+            provider="google",
+            operation="generate_content",
+            batch_size=len(prompts)
+        ) as span:
+            response = await self.model.generate_content_async(contents)
+            span.set_attribute("response_length", len(response.text))
+        
+        results = {
+            int(case_id): body.strip()
+            for case_id, body in _BATCH_RESULT_RE.findall(response.text)
+        }
+        if sorted(results) != list(range(1, len(prompts) + 1)):
+            raise ValueError(f"Batch VLM response has results for cases {sorted(results)}, expected 1..{len(prompts)}")
+        
+        return [results[case_id] for case_id in range(1, len(prompts) + 1)]
@@ -6,9 +6,15 @@ VLM validation prompt templates.
 # VLM Validation Prompts
 # ============================================================================
 
-VLM_PLAYABLE_VALIDATION_PROMPT = """Given the attached screenshot, decide where the playable code is correct and relevant to the original prompt. Keep in mind that the backend is currently not implemented, so you can only validate the frontend code and ignore the backend part.
+# The playable prompt has a normal and a feedback-iteration variant. They are
+# built from shared parts so each mode gets its own template without an
+# {% if is_feedback_mode %} branch; VLM_PLAYABLE_VALIDATION_PROMPT keeps the
+# combined template for callers that pass is_feedback_mode at render time.
+_PLAYABLE_INTRO = """Given the attached screenshot, decide where the playable code is correct and relevant to the original prompt. Keep in mind that the backend is currently not implemented, so you can only validate the frontend code and ignore the backend part.
 
-{% if is_feedback_mode %}
+"""
+
+_PLAYABLE_FEEDBACK_CONTEXT = """
 **FEEDBACK ITERATION MODE**
 
 This is a feedback iteration on an existing game.
@@ -23,9 +29,13 @@ IMPORTANT: Since this is a feedback iteration adding/modifying specific features
 3. The core game functionality remains intact
 
 The specific feature requested in the feedback will be validated separately through dedicated test cases. Therefore, if the main game looks functional and has no errors, you can approve it even if the specific feedback feature isn't prominently visible yet.
-{% else %}
+"""
+
+_PLAYABLE_NORMAL_CONTEXT = """
 Original prompt to generate this playable: {{ user_prompt }}.
-{% endif %}
+"""
+
+_PLAYABLE_INSTRUCTIONS = """
 
 Console logs from the browsers:
 {{ console_logs }}
@@ -50,13 +60,29 @@ Example 4:
 <reason>the playable looks good and works correctly. The WebGL performance warnings in the logs are normal browser behavior and can be ignored</reason>
 <answer>yes</answer>
 
-{% if is_feedback_mode %}
+"""
+
+_PLAYABLE_FEEDBACK_EXAMPLE = """
 Example 5 (Feedback Mode):
 <reason>This is a feedback iteration adding a score counter. The game loads correctly without errors and the core gameplay is intact. The score counter feature will be validated in dedicated test cases, so the main validation passes.</reason>
 <answer>yes</answer>
-{% endif %}
 """
 
+VLM_PLAYABLE_NORMAL_PROMPT = _PLAYABLE_INTRO + _PLAYABLE_NORMAL_CONTEXT + _PLAYABLE_INSTRUCTIONS + "\n"
+
+VLM_PLAYABLE_FEEDBACK_PROMPT = (
+    _PLAYABLE_INTRO + _PLAYABLE_FEEDBACK_CONTEXT + _PLAYABLE_INSTRUCTIONS
+    + _PLAYABLE_FEEDBACK_EXAMPLE + "\n"
+)
+
+VLM_PLAYABLE_VALIDATION_PROMPT = (
+    _PLAYABLE_INTRO
+    + "{% if is_feedback_mode %}" + _PLAYABLE_FEEDBACK_CONTEXT
+    + "{% else %}" + _PLAYABLE_NORMAL_CONTEXT + "{% endif %}"
+    + _PLAYABLE_INSTRUCTIONS
+    + "{% if is_feedback_mode %}" + _PLAYABLE_FEEDBACK_EXAMPLE + "{% endif %}\n"
+)
+
 VLM_TEST_CASE_VALIDATION_PROMPT = """You are validating a specific game state loaded from a test case.
 
 The game has loaded a test case with the following expected output:
@@ -85,3 +111,26 @@ Example 3:
 <answer>no</answer>
 """
 
+
+# ============================================================================
+# Batched VLM Validation
+# ============================================================================
+
+# Wraps several per-test-case prompts (each followed by its screenshot) into a
+# single request. {count} is the number of test cases in the batch.
+VLM_BATCH_VALIDATION_HEADER = """You will validate {count} independent test cases. Each test case is wrapped in a <test_case id="N"> block containing its instructions followed by its screenshot.
+
+Evaluate every test case separately, using only its own instructions and screenshot."""
+
+VLM_BATCH_VALIDATION_FOOTER = """For EVERY test case, answer in a <result id="N"> block with the same id, containing the <reason> and <answer> tags requested by that test case. Follow the example below.
+
+Example:
+<result id="1">
+<reason>The screenshot shows score 100 as expected</reason>
+<answer>yes</answer>
+</result>
+<result id="2">
+<reason>Expected the level complete screen but the game is still on level 1</reason>
+<answer>no</answer>
+</result>
+"""
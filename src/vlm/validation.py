@@ -1,19 +1,56 @@
 """
 VLM validation utilities for playable testing and validation.
+
+Screenshots, test case JSON and failure reports are saved under
+games/<session_id>/debug/ for debugging. Set PLAYABLE_DEBUG=0 to skip
+writing them.
 """
-import re
-import io
+import os
+import asyncio
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 from pathlib import Path
 from datetime import datetime
-from PIL import Image
-from jinja2 import Template
+from src.vlm.client import render_prompt, image_part
+from src.vlm.cache import (
+    get_cached_response,
+    cache_response,
+    has_verdict,
+    PLAYABLE_CACHE_TTL,
+    TEST_CASE_CACHE_TTL
+)
 
 logger = logging.getLogger(__name__)
 
+# Debug artifacts are only written when PLAYABLE_DEBUG isn't "0"
+# (src.vlm.client has already loaded .env at this point)
+_DEBUG_ENABLED = os.environ.get("PLAYABLE_DEBUG", "1") != "0"
+# Returned instead of a file path when debug artifacts are disabled
+_DEBUG_DISABLED_PATH = Path("debug_disabled")
+
+# Debug artifacts are written on one background thread (in submission order) so
+# validation doesn't wait on disk I/O before calling the VLM
+_debug_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vlm-debug-writer")
+
+# Test run directories already created, by (session_id, test_run_id), so each
+# one is only mkdir'ed once per process
+_TEST_RUN_DIR_CACHE: dict[tuple[str, str], Path] = {}
+# Debug files are saved from the background writer and worker threads
+_test_run_dir_lock = threading.Lock()
+
+# Digest of the test case JSON last written to each path (oldest evicted first),
+# so re-validating an unchanged test case doesn't rewrite its file
+_LAST_WRITTEN: dict[Path, bytes] = {}
+MAX_LAST_WRITTEN = 256
+
+# Lowercases ASCII letters only, so indexes in the lowered text match the original
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
 
-def validate_playable_with_vlm(
+async def validate_playable_with_vlm(
     vlm_client,
     screenshot_bytes: bytes,
     console_logs: list[str],
@@ -43,8 +80,8 @@ def validate_playable_with_vlm(
     """
     try:
         # Save debug screenshot with timestamp
-        debug_image_path = _save_debug_screenshot(screenshot_bytes, "main_validation", session_id, test_run_id)
-        logger.info(f"Debug screenshot saved to: {debug_image_path}")
+        if _DEBUG_ENABLED:
+            _debug_writer.submit(_save_debug_screenshot, screenshot_bytes, "main_validation", session_id, test_run_id)
         
         # Format console logs for display
         if console_logs:
@@ -57,8 +94,8 @@ def validate_playable_with_vlm(
             logger.info(f"Feedback mode: original='{original_prompt[:50]}...', feedback='{user_prompt[:50]}...'")
         
         # Render the template with context
-        template = Template(template_str)
-        rendered_prompt = template.render(
+        rendered_prompt = render_prompt(
+            template_str,
             user_prompt=user_prompt,
             console_logs=formatted_logs,
             is_feedback_mode=is_feedback_mode,
@@ -67,11 +104,14 @@ def validate_playable_with_vlm(
         
         logger.debug(f"Rendered VLM prompt: {rendered_prompt[:200]}...")
         
-        # Call VLM with screenshot and rendered prompt
-        image = Image.open(io.BytesIO(screenshot_bytes))
-        
-        response = vlm_client.model.generate_content([rendered_prompt, image])
-        vlm_response = response.text
+        # Call VLM with screenshot and rendered prompt, unless this exact
+        # screenshot was already validated with the same prompt
+        vlm_response = get_cached_response(screenshot_bytes, rendered_prompt)
+        if vlm_response is None:
+            response = await vlm_client.model.generate_content_async([rendered_prompt, image_part(screenshot_bytes)])
+            vlm_response = response.text
+            if has_verdict(vlm_response):
+                cache_response(screenshot_bytes, rendered_prompt, vlm_response, PLAYABLE_CACHE_TTL)
         
         # Parse response to extract answer and reason
         is_valid, reason = _parse_vlm_response(vlm_response)
@@ -89,7 +129,7 @@ def validate_playable_with_vlm(
         return False, error_msg
 
 
-def validate_test_case_with_vlm(
+async def validate_test_case_with_vlm(
     vlm_client,
     screenshot_bytes: bytes,
     expected_output: str,
@@ -119,34 +159,35 @@ def validate_test_case_with_vlm(
         logger.info(f"Validating test case with VLM. Expected: {expected_output[:100]}...")
         
         # Save debug screenshot with test case name
-        debug_image_path = _save_debug_screenshot(screenshot_bytes, test_case_name, session_id, test_run_id)
-        logger.info(f"Debug screenshot for {test_case_name} saved to: {debug_image_path}")
-        
-        # Save test case JSON alongside screenshot if provided
-        if test_case_json and session_id:
-            _save_test_case_json(test_case_json, test_case_name, session_id, test_run_id)
-            logger.info(f"Test case JSON for {test_case_name} saved to debug folder")
+        if _DEBUG_ENABLED:
+            _debug_writer.submit(_save_debug_screenshot, screenshot_bytes, test_case_name, session_id, test_run_id)
+            
+            # Save test case JSON alongside screenshot if provided
+            if test_case_json and session_id:
+                _debug_writer.submit(_save_test_case_json, test_case_json, test_case_name, session_id, test_run_id)
         
         # Render the prompt template
-        template = Template(template_str)
-        rendered_prompt = template.render(expected_output=expected_output)
+        rendered_prompt = render_prompt(template_str, expected_output=expected_output)
         
         logger.debug(f"Rendered test case prompt: {rendered_prompt[:200]}...")
         
-        # Convert bytes to PIL Image
-        image = Image.open(io.BytesIO(screenshot_bytes))
-        
-        # Call VLM directly with the image and prompt
-        # Note: We're not using validate_with_screenshot because we don't need console logs
-        from src.vlm.client import VLMClient
-        if not isinstance(vlm_client, VLMClient):
-            # Create client if needed
-            vlm_client = VLMClient()
-        
-        response = vlm_client.model.generate_content([rendered_prompt, image])
-        vlm_response = response.text
-        
-        logger.info("VLM test case validation response received")
+        # Unchanged test cases on a retry produce the same screenshot and prompt
+        vlm_response = get_cached_response(screenshot_bytes, rendered_prompt)
+        if vlm_response is None:
+            # Call VLM directly with the image and prompt
+            # Note: We're not using validate_with_screenshot because we don't need console logs
+            from src.vlm.client import VLMClient
+            if not isinstance(vlm_client, VLMClient):
+                # Create client if needed
+                vlm_client = VLMClient()
+            
+            # Async request so other test cases keep running while it's in flight
+            response = await vlm_client.model.generate_content_async([rendered_prompt, image_part(screenshot_bytes)])
+            vlm_response = response.text
+            if has_verdict(vlm_response):
+                cache_response(screenshot_bytes, rendered_prompt, vlm_response, TEST_CASE_CACHE_TTL)
+            
+            logger.info("VLM test case validation response received")
  
         # Parse response to extract answer and reason
         is_valid, reason = _parse_vlm_response(vlm_response)
@@ -164,6 +205,95 @@ def validate_test_case_with_vlm(
         return False, error_msg
 
 
+async def validate_test_cases_with_vlm(
+    vlm_client,
+    test_cases: list[dict],
+    template_str: str,
+    session_id: str = None,
+    test_run_id: str = None
+) -> list[Tuple[bool, str]]:
+    """
+    Validate several test cases with a single batched VLM request.
+    
+    Falls back to concurrent validate_test_case_with_vlm calls, one per test
+    case, if the batched request fails or its response can't be matched to
+    the test cases.
+    
+    Args:
+        vlm_client: VLMClient instance
+        test_cases: One dict per test case with the keys screenshot_bytes,
+            expected_output, test_case_name and test_case_json
+        template_str: Jinja2 template string for the per-test-case prompt
+        session_id: Session ID for organizing debug files (optional)
+        test_run_id: Test run timestamp for organizing files (optional, will create new if None)
+    
+    Returns:
+        List of (is_valid: bool, reason: str), in the same order as test_cases
+    """
+    if len(test_cases) == 1:
+        return [await validate_test_case_with_vlm(
+            vlm_client=vlm_client,
+            template_str=template_str,
+            session_id=session_id,
+            test_run_id=test_run_id,
+            **test_cases[0]
+        )]
+    
+    try:
+        prompts = []
+        for test_case in test_cases:
+            if _DEBUG_ENABLED:
+                test_case_name = test_case["test_case_name"]
+                _debug_writer.submit(
+                    _save_debug_screenshot, test_case["screenshot_bytes"], test_case_name, session_id, test_run_id
+                )
+                if test_case["test_case_json"] and session_id:
+                    _debug_writer.submit(
+                        _save_test_case_json, test_case["test_case_json"], test_case_name, session_id, test_run_id
+                    )
+            prompts.append(render_prompt(template_str, expected_output=test_case["expected_output"]))
+        
+        # Only send test cases whose screenshot and prompt weren't validated before
+        screenshots = [test_case["screenshot_bytes"] for test_case in test_cases]
+        responses = [
+            get_cached_response(screenshot_bytes, prompt)
+            for screenshot_bytes, prompt in zip(screenshots, prompts)
+        ]
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if misses:
+            batch_responses = await vlm_client.validate_batch(
+                screenshots=[screenshots[i] for i in misses],
+                prompts=[prompts[i] for i in misses]
+            )
+            for i, response in zip(misses, batch_responses):
+                responses[i] = response
+                if has_verdict(response):
+                    cache_response(screenshots[i], prompts[i], response, TEST_CASE_CACHE_TTL)
+        logger.info(f"VLM cache: {len(test_cases) - len(misses)}/{len(test_cases)} test case(s) cached")
+        results = [_parse_vlm_response(response) for response in responses]
+        
+        for test_case, (is_valid, reason) in zip(test_cases, results):
+            if is_valid:
+                logger.info(f"✅ VLM test case validation passed ({test_case['test_case_name']}): {reason}")
+            else:
+                logger.warning(f"❌ VLM test case validation failed ({test_case['test_case_name']}): {reason}")
+        
+        return results
+        
+    except Exception as e:
+        logger.warning(f"Batched VLM validation failed, validating test cases one by one: {e}")
+        return list(await asyncio.gather(*(
+            validate_test_case_with_vlm(
+                vlm_client=vlm_client,
+                template_str=template_str,
+                session_id=session_id,
+                test_run_id=test_run_id,
+                **test_case
+            )
+            for test_case in test_cases
+        )))
+
+
 def save_test_case_error(
     test_case_name: str,
     expected_output: str,
@@ -186,16 +316,20 @@ def save_test_case_error(
     Returns:
         Path to saved error file
     """
+    if not _DEBUG_ENABLED:
+        return _DEBUG_DISABLED_PATH
+    
     try:
         # Get test run directory
-        debug_dir = _get_test_run_dir(session_id, test_run_id)
+        now = datetime.now()
+        debug_dir = _get_test_run_dir(session_id, test_run_id, now)
         
         # Create error content
         error_content = f"""Test Case Failure Report
 ========================
 
 Test Case: {test_case_name}
-Timestamp: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Timestamp: {now.strftime("%Y-%m-%d %H:%M:%S")}
 
 Expected Output:
 {expected_output}
@@ -220,6 +354,24 @@ Error Message:
         return Path("temp/test_cases/failed_to_save_error.txt")
 
 
+def _extract_tag(text: str, lowered: str, tag: str) -> str | None:
+    """
+    Return the stripped content of the first <tag>...</tag> in text, or None.
+    
+    Plain str.find scans instead of a regex: one linear pass, no backtracking.
+    lowered is text with ASCII letters lowercased and is only used for the search.
+    """
+    open_tag = f"<{tag}>"
+    start = lowered.find(open_tag)
+    if start == -1:
+        return None
+    start += len(open_tag)
+    end = lowered.find(f"</{tag}>", start)
+    if end == -1:
+        return None
+    return text[start:end].strip()
+
+
 def _parse_vlm_response(response_text: str) -> Tuple[bool, str]:
     """
     Parse VLM response to extract answer and reason tags.
@@ -231,20 +383,20 @@ def _parse_vlm_response(response_text: str) -> Tuple[bool, str]:
         Tuple of (is_valid: bool, reason: str)
     """
     try:
+        # Tags are matched case-insensitively on a lowered copy
+        lowered = response_text.translate(_ASCII_LOWER)
+        
         # Extract <answer> tag
-        answer_match = re.search(r'<answer>\s*(yes|no)\s*</answer>', response_text, re.IGNORECASE)
-        if not answer_match:
+        answer = _extract_tag(response_text, lowered, "answer")
+        if answer is None or answer.lower() not in ("yes", "no"):
             logger.warning(f"Could not find <answer> tag in VLM response: {response_text[:200]}...")
             return False, f"Invalid VLM response format: {response_text[:200]}..."
         
-        answer = answer_match.group(1).lower()
-        is_valid = answer == "yes"
+        is_valid = answer.lower() == "yes"
         
         # Extract <reason> tag
-        reason_match = re.search(r'<reason>\s*(.*?)\s*</reason>', response_text, re.IGNORECASE | re.DOTALL)
-        if reason_match:
-            reason = reason_match.group(1).strip()
-        else:
+        reason = _extract_tag(response_text, lowered, "reason")
+        if reason is None:
             # Fallback: use the whole response if no reason tag found
             reason = response_text.strip()
             logger.warning(f"Could not find <reason> tag, using full response")
@@ -256,23 +408,29 @@ def _parse_vlm_response(response_text: str) -> Tuple[bool, str]:
         return False, f"Failed to parse VLM response: {str(e)}"
 
 
-def _get_test_run_dir(session_id: str, test_run_id: str = None) -> Path:
+def _get_test_run_dir(session_id: str, test_run_id: str = None, now: datetime = None) -> Path:
     """
     Get or create a test run directory for organizing debug files.
     
     Args:
         session_id: Session ID (game ID)
         test_run_id: Test run timestamp (if None, creates a new one)
+        now: Current time, if the caller already has it (optional)
     
     Returns:
         Path to test run directory
     """
     if not test_run_id:
         # Create new test run timestamp
-        test_run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        test_run_id = (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
     
-    test_run_dir = Path("games") / session_id / "debug" / test_run_id
-    test_run_dir.mkdir(parents=True, exist_ok=True)
+    key = (session_id, test_run_id)
+    with _test_run_dir_lock:
+        test_run_dir = _TEST_RUN_DIR_CACHE.get(key)
+        if test_run_dir is None:
+            test_run_dir = Path("games") / session_id / "debug" / test_run_id
+            test_run_dir.mkdir(parents=True, exist_ok=True)
+            _TEST_RUN_DIR_CACHE[key] = test_run_dir
     return test_run_dir
 
 
@@ -302,12 +460,12 @@ def _save_debug_screenshot(screenshot_bytes: bytes, name_prefix: str = "screensh
                 filename = f"{name_prefix}_screenshot.png"
         else:
             # Fallback to old timestamp-based structure
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             debug_dir = Path("temp") / "debug_images" / timestamp
             debug_dir.mkdir(parents=True, exist_ok=True)
             
-            microseconds = datetime.now().strftime("%f")[:3]
-            filename = f"{name_prefix}_{timestamp}_{microseconds}.png"
+            filename = f"{name_prefix}_{timestamp}_{now.microsecond // 1000:03d}.png"
         
         screenshot_path = debug_dir / filename
         screenshot_path.write_bytes(screenshot_bytes)
@@ -341,7 +499,18 @@ def _save_test_case_json(test_case_json: str, test_case_name: str, session_id: s
         # Save test case with simple naming: test_case_1.json
         filename = f"{test_case_name}.json"
         test_case_path = debug_dir / filename
-        test_case_path.write_text(test_case_json, encoding='utf-8')
+        data = test_case_json.encode('utf-8')
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        if _LAST_WRITTEN.get(test_case_path) == digest:
+            logger.debug(f"Test case JSON unchanged, not rewriting: {test_case_path}")
+            return test_case_path
+        
+        test_case_path.write_bytes(data)
+        # Only the single debug writer thread saves test case JSON, so no lock is needed
+        _LAST_WRITTEN.pop(test_case_path, None)
+        _LAST_WRITTEN[test_case_path] = digest
+        while len(_LAST_WRITTEN) > MAX_LAST_WRITTEN:
+            del _LAST_WRITTEN[next(iter(_LAST_WRITTEN))]
         
         logger.debug(f"Test case JSON saved to: {test_case_path}")
         return test_case_path
@@ -2,21 +2,32 @@
 Browser testing module using Playwright to validate generated games.
 Runs tests in a containerized Playwright environment using Dagger.
 """
+import os
 import asyncio
-import json
+import base64
+import orjson
 from pathlib import Path
 from typing import Dict, List
 from src.containers import PlaywrightContainer
+from src.containers.playwright_container import TEST_SCRIPTS_DIR
 import dagger
 from dagger import ReturnType
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cap on test runs (each a Node + Chromium exec in Dagger) in flight at once,
+# so concurrent validations don't overload the Dagger engine.
+# Override with PLAYABLE_BROWSER_CONCURRENCY.
+MAX_CONCURRENT_BROWSER_RUNS = int(os.environ.get("PLAYABLE_BROWSER_CONCURRENCY", "8"))
+_browser_runs = asyncio.Semaphore(MAX_CONCURRENT_BROWSER_RUNS)
+
 
 class GameTestResult:
     """Result of browser testing a game."""
     
+    __slots__ = ("success", "errors", "console_logs", "screenshot_bytes")
+    
     def __init__(
         self, 
         success: bool, 
@@ -38,10 +49,25 @@ TEST_SCRIPT = """
 const path = require('path');
 const fs = require('fs');
 
+// Most entries kept in each log list; a noisy game keeps only its latest
+// output, so the result JSON streamed back on stdout stays bounded
+const MAX_LOG_ENTRIES = 500;
+
+// Longest wait for a game's readiness flags before carrying on; games that
+// don't set them get at most the fixed delay the runner used to sleep
+const READY_TIMEOUT_MS = 2000;
+
 async function testGame() {
     const errors = [];
-    const warnings = [];
     const consoleLogs = [];
+    let truncated = 0;
+    const pushLog = (entries, entry) => {
+        if (entries.length >= MAX_LOG_ENTRIES) {
+            entries.shift();
+            truncated++;
+        }
+        entries.push(entry);
+    };
     
     // Import playwright (will be installed globally)
     const { chromium } = require('playwright');
@@ -61,61 +87,67 @@ async function testGame() {
         const msgText = msg.text();
         const logEntry = `[${msgType}] ${msgText}`;
         
-        consoleLogs.push(logEntry);
+        pushLog(consoleLogs, logEntry);
         
         if (msg.type() === 'error') {
-            errors.push(logEntry);
-        } else if (msg.type() === 'warning') {
-            warnings.push(logEntry);
+            pushLog(errors, logEntry);
         }
     });
     
     // Capture page errors
     page.on('pageerror', (error) => {
         const errorMsg = `Uncaught exception: ${error.message}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
     });
     
     // Capture failed requests
     page.on('requestfailed', (request) => {
         const errorMsg = `Failed to load resource: ${request.url()}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
     });
     
-    let screenshotCaptured = false;
+    let screenshotBase64 = null;
     
     try {
         // Load the game
         const indexPath = path.resolve('/app/index.html');
         await page.goto(`file://${indexPath}`, { 
-            waitUntil: 'networkidle',
+            waitUntil: 'load',
             timeout: 10000 
         });
         
-        // Wait for JavaScript initialization
-        await page.waitForTimeout(2000);
+        // Wait for the game to signal it has initialized (window.__gameReady).
+        // Games that don't set the flag get READY_TIMEOUT_MS counted from
+        // navigation start, so time spent loading the page counts towards it
+        await page.waitForFunction(
+            (readyTimeout) => window.__gameReady === true || performance.now() > readyTimeout,
+            READY_TIMEOUT_MS,
+            { timeout: READY_TIMEOUT_MS }
+        ).catch(() => {});
         
         const title = await page.title();
         console.log(`Page loaded: ${title}`);
         
     } catch (error) {
         const errorMsg = `Failed to load page: ${error.message}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
     }
     
     // Always try to capture screenshot, even if page load failed
     try {
-        const screenshotPath = '/app/screenshot.png';
-        await page.screenshot({ path: screenshotPath, fullPage: true });
-        screenshotCaptured = true;
-        console.log(`Screenshot saved to ${screenshotPath}`);
+        // Viewport only: the game is drawn in the viewport, and a full-page
+        // capture has to scroll and stitch the whole document.
+        // Sent back in the result JSON, so no file has to be exported from the container
+        const screenshot = await page.screenshot();
+        screenshotBase64 = screenshot.toString('base64');
+        console.log(`Screenshot captured: ${screenshot.length} bytes`);
     } catch (screenshotError) {
         const errorMsg = `Failed to capture screenshot: ${screenshotError.message}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
         console.error(errorMsg);
     } finally {
         await browser.close();
@@ -126,8 +158,9 @@ async function testGame() {
     const result = {
         success: true,
         errors: errors,
-        warnings: warnings,
-        console_logs: consoleLogs
+        console_logs: consoleLogs,
+        truncated: truncated,
+        screenshot_b64: screenshotBase64
     };
     
     console.log('__TEST_RESULT__' + JSON.stringify(result) + '__END__');
@@ -140,7 +173,6 @@ testGame().catch((error) => {
     console.log('__TEST_RESULT__' + JSON.stringify({
         success: false,
         errors: [`Test execution failed: ${error.message}`],
-        warnings: [],
         console_logs: [`Test execution failed: ${error.message}`]
     }) + '__END__');
     process.exit(1);
@@ -152,10 +184,25 @@ TEST_SCRIPT_WITH_TEST_CASE = """
 const path = require('path');
 const fs = require('fs');
 
+// Most entries kept in each log list; a noisy game keeps only its latest
+// output, so the result JSON streamed back on stdout stays bounded
+const MAX_LOG_ENTRIES = 500;
+
+// Longest wait for a game's readiness flags before carrying on; games that
+// don't set them get at most the fixed delay the runner used to sleep
+const READY_TIMEOUT_MS = 2000;
+
 async function testGameWithTestCase() {
     const errors = [];
-    const warnings = [];
     const consoleLogs = [];
+    let truncated = 0;
+    const pushLog = (entries, entry) => {
+        if (entries.length >= MAX_LOG_ENTRIES) {
+            entries.shift();
+            truncated++;
+        }
+        entries.push(entry);
+    };
     
     // Get test case data from environment variable
     const testCaseJson = process.env.TEST_CASE_DATA;
@@ -163,7 +210,6 @@ async function testGameWithTestCase() {
         console.log('__TEST_RESULT__' + JSON.stringify({
             success: false,
             errors: ['TEST_CASE_DATA environment variable not set'],
-            warnings: [],
             console_logs: ['TEST_CASE_DATA environment variable not set']
         }) + '__END__');
         process.exit(1);
@@ -177,7 +223,6 @@ async function testGameWithTestCase() {
         console.log('__TEST_RESULT__' + JSON.stringify({
             success: false,
             errors: [`Failed to parse test case JSON: ${error.message}`],
-            warnings: [],
             console_logs: [`Failed to parse test case JSON: ${error.message}`]
         }) + '__END__');
         process.exit(1);
@@ -201,41 +246,46 @@ async function testGameWithTestCase() {
         const msgText = msg.text();
         const logEntry = `[${msgType}] ${msgText}`;
         
-        consoleLogs.push(logEntry);
+        pushLog(consoleLogs, logEntry);
         
         if (msg.type() === 'error') {
-            errors.push(logEntry);
-        } else if (msg.type() === 'warning') {
-            warnings.push(logEntry);
+            pushLog(errors, logEntry);
         }
     });
     
     // Capture page errors
     page.on('pageerror', (error) => {
         const errorMsg = `Uncaught exception: ${error.message}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
     });
     
     // Capture failed requests
     page.on('requestfailed', (request) => {
         const errorMsg = `Failed to load resource: ${request.url()}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
     });
     
-    let screenshotCaptured = false;
+    let screenshotBase64 = null;
     
     try {
         // Load the game
         const indexPath = path.resolve('/app/index.html');
         await page.goto(`file://${indexPath}`, { 
-            waitUntil: 'networkidle',
+            waitUntil: 'load',
             timeout: 10000 
         });
         
-        // Wait for JavaScript initialization
-        await page.waitForTimeout(2000);
+        // Wait for the game to signal it has initialized (window.__gameReady).
+        // loadTestCase may be registered before async init finishes, so it is
+        // not a ready signal; games without the flag get READY_TIMEOUT_MS
+        // counted from navigation start, as in TEST_SCRIPT
+        await page.waitForFunction(
+            (readyTimeout) => window.__gameReady === true || performance.now() > readyTimeout,
+            READY_TIMEOUT_MS,
+            { timeout: READY_TIMEOUT_MS }
+        ).catch(() => {});
         
         const title = await page.title();
         console.log(`Page loaded: ${title}`);
@@ -247,8 +297,8 @@ async function testGameWithTestCase() {
         
         if (!hasLoadTestCase) {
             const errorMsg = 'window.loadTestCase function not found in game code';
-            errors.push(errorMsg);
-            consoleLogs.push(errorMsg);
+            pushLog(errors, errorMsg);
+            pushLog(consoleLogs, errorMsg);
         } else {
             // Call window.loadTestCase with the test case data
             console.log('Calling window.loadTestCase...');
@@ -256,27 +306,31 @@ async function testGameWithTestCase() {
                 window.loadTestCase(data);
             }, testCaseData);
             
-            // Wait for game state to stabilize after loading test case
-            await page.waitForTimeout(2000);
+            // Wait for the game to signal the loaded state is rendered
+            // (window.__testCaseReady), at most READY_TIMEOUT_MS
+            await page.waitForFunction(() => window.__testCaseReady === true, null, { timeout: READY_TIMEOUT_MS })
+                .catch(() => {});
             console.log('Test case loaded and game state stabilized');
         }
         
     } catch (error) {
         const errorMsg = `Failed to load page or test case: ${error.message}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
     }
     
     // Always try to capture screenshot, even if page load failed
     try {
-        const screenshotPath = '/app/screenshot.png';
-        await page.screenshot({ path: screenshotPath, fullPage: true });
-        screenshotCaptured = true;
-        console.log(`Screenshot saved to ${screenshotPath}`);
+        // Viewport only: the game is drawn in the viewport, and a full-page
+        // capture has to scroll and stitch the whole document.
+        // Sent back in the result JSON, so no file has to be exported from the container
+        const screenshot = await page.screenshot();
+        screenshotBase64 = screenshot.toString('base64');
+        console.log(`Screenshot captured: ${screenshot.length} bytes`);
     } catch (screenshotError) {
         const errorMsg = `Failed to capture screenshot: ${screenshotError.message}`;
-        errors.push(errorMsg);
-        consoleLogs.push(errorMsg);
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
         console.error(errorMsg);
     } finally {
         await browser.close();
@@ -286,8 +340,9 @@ async function testGameWithTestCase() {
     const result = {
         success: true,
         errors: errors,
-        warnings: warnings,
-        console_logs: consoleLogs
+        console_logs: consoleLogs,
+        truncated: truncated,
+        screenshot_b64: screenshotBase64
     };
     
     console.log('__TEST_RESULT__' + JSON.stringify(result) + '__END__');
@@ -300,7 +355,6 @@ testGameWithTestCase().catch((error) => {
     console.log('__TEST_RESULT__' + JSON.stringify({
         success: false,
         errors: [`Test execution failed: ${error.message}`],
-        warnings: [],
         console_logs: [`Test execution failed: ${error.message}`]
     }) + '__END__');
     process.exit(1);
@@ -308,76 +362,280 @@ testGameWithTestCase().catch((error) => {
 """
 
 
-def _parse_test_output(output: str) -> Dict:
-    """Parse the test output and extract JSON result."""
-    # Look for the JSON result marker
-    start_marker = '__TEST_RESULT__'
-    end_marker = '__END__'
+# JavaScript test script that runs several test cases in one Node process.
+# The browser is launched once; each test case gets its own browser context
+# and the test cases run concurrently. One result marker is printed per test
+# case, tagged with its index in TEST_CASES_DATA.
+TEST_SCRIPT_WITH_TEST_CASES = """
+const path = require('path');
+const fs = require('fs');
+
+// Most entries kept in each log list; a noisy game keeps only its latest
+// output, so the result JSON streamed back on stdout stays bounded
+const MAX_LOG_ENTRIES = 500;
+
+// Longest wait for a game's readiness flags before carrying on; games that
+// don't set them get at most the fixed delay the runner used to sleep
+const READY_TIMEOUT_MS = 2000;
+
+async function runTestCase(browser, testCase, index) {
+    const errors = [];
+    const consoleLogs = [];
+    let truncated = 0;
+    const pushLog = (entries, entry) => {
+        if (entries.length >= MAX_LOG_ENTRIES) {
+            entries.shift();
+            truncated++;
+        }
+        entries.push(entry);
+    };
+    
+    let testCaseData;
+    try {
+        testCaseData = JSON.parse(testCase.json);
+    } catch (error) {
+        const errorMsg = `Failed to parse test case JSON: ${error.message}`;
+        return { index, success: false, errors: [errorMsg], console_logs: [errorMsg] };
+    }
+    
+    // A fresh context per test case, so no state leaks between test cases
+    const context = await browser.newContext();
+    const page = await context.newPage();
+    
+    // Capture all console messages (errors, warnings, logs)
+    page.on('console', (msg) => {
+        const msgType = msg.type().toUpperCase();
+        const msgText = msg.text();
+        const logEntry = `[${msgType}] ${msgText}`;
+        
+        pushLog(consoleLogs, logEntry);
+        
+        if (msg.type() === 'error') {
+            pushLog(errors, logEntry);
+        }
+    });
+    
+    // Capture page errors
+    page.on('pageerror', (error) => {
+        const errorMsg = `Uncaught exception: ${error.message}`;
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
+    });
+    
+    // Capture failed requests
+    page.on('requestfailed', (request) => {
+        const errorMsg = `Failed to load resource: ${request.url()}`;
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
+    });
+    
+    try {
+        // Load the game
+        const indexPath = path.resolve('/app/index.html');
+        await page.goto(`file://${indexPath}`, { 
+            waitUntil: 'load',
+            timeout: 10000 
+        });
+        
+        // Wait for the game to signal it has initialized (window.__gameReady).
+        // loadTestCase may be registered before async init finishes, so it is
+        // not a ready signal; games without the flag get READY_TIMEOUT_MS
+        // counted from navigation start, as in TEST_SCRIPT
+        await page.waitForFunction(
+            (readyTimeout) => window.__gameReady === true || performance.now() > readyTimeout,
+            READY_TIMEOUT_MS,
+            { timeout: READY_TIMEOUT_MS }
+        ).catch(() => {});
+        
+        const title = await page.title();
+        console.log(`[${testCase.name}] Page loaded: ${title}`);
+        
+        // Check if window.loadTestCase exists
+        const hasLoadTestCase = await page.evaluate(() => {
+            return typeof window.loadTestCase === 'function';
+        });
+        
+        if (!hasLoadTestCase) {
+            const errorMsg = 'window.loadTestCase function not found in game code';
+            pushLog(errors, errorMsg);
+            pushLog(consoleLogs, errorMsg);
+        } else {
+            // Call window.loadTestCase with the test case data
+            await page.evaluate((data) => {
+                window.loadTestCase(data);
+            }, testCaseData);
+            
+            // Wait for the game to signal the loaded state is rendered
+            // (window.__testCaseReady), at most READY_TIMEOUT_MS
+            await page.waitForFunction(() => window.__testCaseReady === true, null, { timeout: READY_TIMEOUT_MS })
+                .catch(() => {});
+            console.log(`[${testCase.name}] Test case loaded and game state stabilized`);
+        }
+        
+    } catch (error) {
+        const errorMsg = `Failed to load page or test case: ${error.message}`;
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
+    }
     
-    start_idx = output.find(start_marker)
-    end_idx = output.find(end_marker)
+    // Always try to capture screenshot, even if page load failed
+    let screenshotBase64 = null;
+    try {
+        const screenshot = await page.screenshot();
+        screenshotBase64 = screenshot.toString('base64');
+    } catch (screenshotError) {
+        const errorMsg = `Failed to capture screenshot: ${screenshotError.message}`;
+        pushLog(errors, errorMsg);
+        pushLog(consoleLogs, errorMsg);
+        console.error(errorMsg);
+    } finally {
+        await context.close();
+    }
     
-    if start_idx == -1 or end_idx == -1:
+    return { index, success: true, errors, console_logs: consoleLogs, truncated, screenshot_b64: screenshotBase64 };
+}
+
+async function testGameWithTestCases() {
+    // Array of {name, json} from the environment
+    const testCases = JSON.parse(process.env.TEST_CASES_DATA || '[]');
+    
+    // Import playwright (will be installed globally)
+    const { chromium } = require('playwright');
+    
+    // Launch once for all test cases, with flags to allow file:// protocol access to local assets
+    const browser = await chromium.launch({
+        args: [
+            '--allow-file-access-from-files',
+            '--disable-web-security'
+        ]
+    });
+    
+    try {
+        const results = await Promise.all(
+            testCases.map((testCase, index) => runTestCase(browser, testCase, index))
+        );
+        for (const result of results) {
+            console.log('__TEST_RESULT__' + JSON.stringify(result) + '__END__');
+        }
+    } finally {
+        await browser.close();
+    }
+    
+    // Always exit with 0 since VLM will determine actual success
+    process.exit(0);
+}
+
+testGameWithTestCases().catch((error) => {
+    // No index - applies to every test case
+    console.log('__TEST_RESULT__' + JSON.stringify({
+        success: false,
+        errors: [`Test execution failed: ${error.message}`],
+        console_logs: [`Test execution failed: ${error.message}`]
+    }) + '__END__');
+    process.exit(1);
+});
+"""
+
+# Built-in test runner scripts, baked into every PlaywrightContainer's base
+# layer under TEST_SCRIPTS_DIR by filename
+TEST_RUNNER = "test-runner.js"
+TEST_CASE_RUNNER = "test-case-runner.js"
+TEST_CASES_RUNNER = "test-cases-runner.js"
+TEST_SCRIPT_FILES = {
+    TEST_RUNNER: TEST_SCRIPT,
+    TEST_CASE_RUNNER: TEST_SCRIPT_WITH_TEST_CASE,
+    TEST_CASES_RUNNER: TEST_SCRIPT_WITH_TEST_CASES,
+}
+
+# Each result is printed as __TEST_RESULT__{...}__END__, one per test case in batched output
+_RESULT_START = '__TEST_RESULT__'
+_RESULT_END = '__END__'
+
+
+def _iter_result_payloads(output: str):
+    """
+    Yield the JSON text between each pair of result markers.
+    
+    Uses str.find rather than a lazy regex: the payload carries the base64
+    screenshot, and a lazy match tries the end marker at every byte of it.
+    """
+    position = 0
+    while (start := output.find(_RESULT_START, position)) != -1:
+        start += len(_RESULT_START)
+        end = output.find(_RESULT_END, start)
+        if end == -1:
+            return
+        yield output[start:end]
+        position = end + len(_RESULT_END)
+
+
+def _parse_test_outputs(output: str) -> List[Dict]:
+    """Parse the batched test output and extract every JSON result."""
+    results = [orjson.loads(payload) for payload in _iter_result_payloads(output)]
+    if not results:
         logger.error(f"Could not find test result markers in output:\n{output}")
-        return {
+        return [{
             'success': False,
             'errors': ["Failed to parse test output - no result markers found"],
             'console_logs': []
-        }
-    
-    json_str = output[start_idx + len(start_marker):end_idx]
-    result = json.loads(json_str)
-    
-    return result
+        }]
+    return results
+
+
+def _parse_test_output(output: str) -> Dict:
+    """Parse the test output and extract JSON result."""
+    return _parse_test_outputs(output)[0]
+
+
+def _pop_screenshot(parsed_result: Dict) -> bytes | None:
+    """Remove the base64 screenshot from a parsed test result and decode it."""
+    screenshot_b64 = parsed_result.pop('screenshot_b64', None)
+    return base64.b64decode(screenshot_b64) if screenshot_b64 else None
 
 
 async def validate_game_in_workspace(container: PlaywrightContainer) -> GameTestResult:
     """
     Test a game in a PlaywrightContainer using Playwright.
     
+    Runs TEST_SCRIPT, which is baked into the container's base layer.
     The container should already have:
     - Game files copied via copy_directory()
-    - Test script added via with_test_script()
     
     Args:
-        container: PlaywrightContainer with game files and test script
+        container: PlaywrightContainer with game files
     
     Returns:
         GameTestResult with success status, errors, console logs, and screenshot
     """
     logger.info("Running browser tests in PlaywrightContainer...")
     
-    # Execute the test script in the container
-    executed_container = container.container().with_exec(
-        ["node", "test-runner.js"],
-        expect=ReturnType.ANY
-    )
-    
-    # Get the output (this will work even if exit code is non-zero)
-    output = await executed_container.stdout()
-    exit_code = await executed_container.exit_code()
+    async with _browser_runs:
+        # Execute the test script in the container
+        executed_container = container.container().with_exec(
+            ["node", f"{TEST_SCRIPTS_DIR}/{TEST_RUNNER}"],
+            expect=ReturnType.ANY
+        )
+        
+        # Get the output (this will work even if exit code is non-zero); both
+        # are fetched together, and the screenshot travels in stdout
+        output, exit_code = await asyncio.gather(
+            executed_container.stdout(),
+            executed_container.exit_code()
+        )
     
     logger.info(f"Test completed with exit code {exit_code}")
     
     # Parse the output
     parsed_result = _parse_test_output(output)
     
-    # Extract screenshot from container
-    # We continue even if screenshot extraction fails since test results are still valuable
-    screenshot_bytes = None
-
-    import tempfile
-    from pathlib import Path as PathLib
+    if parsed_result.get('truncated'):
+        logger.warning(f"Browser logs capped at their latest entries, {parsed_result['truncated']} dropped")
+    
+    # The screenshot comes back base64-encoded in the result JSON
+    screenshot_bytes = _pop_screenshot(parsed_result)
+    if screenshot_bytes is None:
+        raise RuntimeError("Test run did not capture a screenshot")
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_screenshot = PathLib(tmpdir) / "screenshot.png"
-        
-        # Export screenshot from container to temp file
-        await executed_container.file("/app/screenshot.png").export(str(tmp_screenshot))
-        
-        # Read the exported file as bytes
-        screenshot_bytes = tmp_screenshot.read_bytes()
-        
     logger.info(f"Screenshot extracted successfully: {len(screenshot_bytes)} bytes")
     
 
@@ -420,41 +678,35 @@ async def validate_game_with_test_case(
     """
     logger.info(f"Running browser tests with test case: {test_case_name}")
     
-    # Add test script with test case support
-    container = container.with_test_script(TEST_SCRIPT_WITH_TEST_CASE)
-    
     # Add test case data as environment variable
     container = container.container().with_env_variable("TEST_CASE_DATA", test_case_json)
     
-    # Execute the test script
-    executed_container = container.with_exec(
-        ["node", "test-runner.js"],
-        expect=ReturnType.ANY
-    )
-    
-    # Get the output
-    output = await executed_container.stdout()
-    exit_code = await executed_container.exit_code()
+    async with _browser_runs:
+        # Execute the test script
+        executed_container = container.with_exec(
+            ["node", f"{TEST_SCRIPTS_DIR}/{TEST_CASE_RUNNER}"],
+            expect=ReturnType.ANY
+        )
+        
+        # Get the output; both are fetched together, and the screenshot travels in stdout
+        output, exit_code = await asyncio.gather(
+            executed_container.stdout(),
+            executed_container.exit_code()
+        )
     
     logger.info(f"Test case '{test_case_name}' completed with exit code {exit_code}")
     
     # Parse the output
     parsed_result = _parse_test_output(output)
     
-    # Extract screenshot from container
-    screenshot_bytes = None
-    import tempfile
-    from pathlib import Path as PathLib
+    if parsed_result.get('truncated'):
+        logger.warning(f"Test case '{test_case_name}' logs capped at their latest entries, {parsed_result['truncated']} dropped")
+    
+    # The screenshot comes back base64-encoded in the result JSON
+    screenshot_bytes = _pop_screenshot(parsed_result)
+    if screenshot_bytes is None:
+        raise RuntimeError(f"Test case '{test_case_name}' did not capture a screenshot")
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_screenshot = PathLib(tmpdir) / "screenshot.png"
-        
-        # Export screenshot from container to temp file
-        await executed_container.file("/app/screenshot.png").export(str(tmp_screenshot))
-        
-        # Read the exported file as bytes
-        screenshot_bytes = tmp_screenshot.read_bytes()
-        
     logger.info(f"Screenshot extracted for test case '{test_case_name}': {len(screenshot_bytes)} bytes")
 
     # Create GameTestResult with all data
@@ -474,3 +726,87 @@ async def validate_game_with_test_case(
     
     return result
 
+
+async def validate_game_with_test_cases(
+    container: PlaywrightContainer,
+    test_cases: List[tuple[str, str]]
+) -> List[GameTestResult]:
+    """
+    Test a game with several test cases in a single browser run.
+    
+    The browser is launched once and the test cases run concurrently, each in
+    its own browser context, instead of paying Node + Chromium startup per
+    test case.
+    
+    The container should already have:
+    - Game files copied via copy_directory()
+    
+    Args:
+        container: PlaywrightContainer with game files
+        test_cases: (test_case_name, test_case_json) pairs
+    
+    Returns:
+        GameTestResult for each test case, in the same order as test_cases
+    """
+    test_case_names = [test_case_name for test_case_name, _ in test_cases]
+    logger.info(f"Running browser tests with test cases: {', '.join(test_case_names)}")
+    
+    # Add the test cases as an environment variable
+    test_cases_data = orjson.dumps([
+        {"name": test_case_name, "json": test_case_json}
+        for test_case_name, test_case_json in test_cases
+    ]).decode()
+    container = container.container().with_env_variable("TEST_CASES_DATA", test_cases_data)
+    
+    async with _browser_runs:
+        # Execute the test script
+        executed_container = container.with_exec(
+            ["node", f"{TEST_SCRIPTS_DIR}/{TEST_CASES_RUNNER}"],
+            expect=ReturnType.ANY
+        )
+        
+        # Get the output; both are fetched together, and the screenshot travels in stdout
+        output, exit_code = await asyncio.gather(
+            executed_container.stdout(),
+            executed_container.exit_code()
+        )
+    
+    logger.info(f"Test cases completed with exit code {exit_code}")
+    
+    # Results are tagged with their test case index; one without an index
+    # means the whole run failed
+    parsed_results = _parse_test_outputs(output)
+    results_by_index = {r['index']: r for r in parsed_results if 'index' in r}
+    run_failure = next((r for r in parsed_results if 'index' not in r), None)
+    
+    results = []
+    for index, test_case_name in enumerate(test_case_names):
+        parsed_result = results_by_index.get(index) or run_failure or {
+            'success': False,
+            'errors': [f"No test result for test case {test_case_name}"],
+            'console_logs': []
+        }
+        
+        if parsed_result.get('truncated'):
+            logger.warning(f"Test case '{test_case_name}' logs capped at their latest entries, {parsed_result['truncated']} dropped")
+        
+        # Each result carries its own screenshot, base64-encoded
+        screenshot_bytes = _pop_screenshot(parsed_result)
+        
+        result = GameTestResult(
+            success=parsed_result.get('success', False),
+            errors=parsed_result.get('errors', []),
+            console_logs=parsed_result.get('console_logs', []),
+            screenshot_bytes=screenshot_bytes
+        )
+        
+        if result.success:
+            logger.info(f"✅ Test case '{test_case_name}' browser tests completed")
+        else:
+            logger.warning(f"❌ Test case '{test_case_name}' browser tests failed")
+            for error in result.errors:
+                logger.warning(f"  - {error}")
+        
+        results.append(result)
+    
+    return results
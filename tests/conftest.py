@@ -4,27 +4,64 @@ Provides shared fixtures like dagger_client and playwright_container.
 """
 import pytest
 import dagger
-from src.containers import PlaywrightContainer
+from src.containers import PlaywrightContainer, Workspace
+from src.vlm.cache import clear_cache
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 async def dagger_client():
     """
-    Function-scoped Dagger client fixture.
-    Creates a Dagger connection for each test.
+    Session-scoped Dagger client fixture.
+    Opens one Dagger connection for the whole test run, since starting a
+    session with the engine costs seconds per connection.
     """
     async with dagger.Connection() as client:
         yield client
 
 
+@pytest.fixture(scope="session")
+async def workspace_template(dagger_client):
+    """
+    Session-scoped empty Workspace, created once per test run.
+    """
+    workspace = await Workspace.create(dagger_client)
+    yield workspace
+
+
 @pytest.fixture(scope="function")
-async def playwright_container(dagger_client):
+async def workspace(workspace_template):
     """
-    Function-scoped PlaywrightContainer fixture.
-    Creates a fresh Playwright container for each test.
+    Function-scoped Workspace fixture.
+    Workspace methods update the instance in place, so each test gets its
+    own clone of the session template.
+    """
+    yield workspace_template.clone()
+
+
+@pytest.fixture(scope="session")
+async def playwright_base(dagger_client):
+    """
+    Session-scoped PlaywrightContainer with Playwright installed.
+    Built once; tests get independent clones via playwright_container.
     """
     container = await PlaywrightContainer.create(dagger_client)
     yield container
 
 
+@pytest.fixture(scope="function")
+async def playwright_container(playwright_base):
+    """
+    Function-scoped PlaywrightContainer fixture.
+    A fresh clone of the session's base container for each test.
+    """
+    yield playwright_base.clone().reset()
+
 
+@pytest.fixture(autouse=True)
+def clear_vlm_cache():
+    """
+    Clear cached VLM responses so mocked responses don't leak between tests.
+    """
+    clear_cache()
+    yield
+    clear_cache()
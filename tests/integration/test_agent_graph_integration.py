@@ -2,6 +2,7 @@
 Integration tests for agent_graph.py
 Tests graph creation, structure, and basic execution patterns.
 """
+import asyncio
 import pytest
 from unittest.mock import Mock
 from langchain_core.messages import HumanMessage, AIMessage
@@ -9,7 +10,6 @@ from src.agent_graph import create_agent_graph
 from src.llm_client import LLMClient
 from src.tools import FileOperations
 from src.custom_types import ToolUse, TextRaw
-from src.containers import Workspace
 import src.agent_graph as agent_graph_module
 
 
@@ -44,17 +44,13 @@ def test_compiled_graph_has_correct_structure():
     expected_nodes = ["llm", "tools", "human_input", "build", "test"]
     for node_name in expected_nodes:
         assert node_name in graph.nodes, f"Missing node: {node_name}"
-    
-    print("✅ Compiled graph has correct structure")
 
 
 @pytest.mark.asyncio
-async def test_graph_creates_with_real_workspace(dagger_client):
+async def test_graph_creates_with_real_workspace(workspace):
     """Test graph can be created with real workspace and containers."""
     llm_client = Mock(spec=LLMClient)
     
-    # Create real workspace
-    workspace = await Workspace.create(dagger_client)
     file_ops = FileOperations(workspace)
     
     # Create graph - this tests that graph creation works with real containers
@@ -63,8 +59,6 @@ async def test_graph_creates_with_real_workspace(dagger_client):
     assert graph is not None
     assert "llm" in graph.nodes
     assert "tools" in graph.nodes
-    
-    print("✅ Graph creates successfully with real workspace")
 
 
 # ============================================================================
@@ -72,28 +66,25 @@ async def test_graph_creates_with_real_workspace(dagger_client):
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_file_operations_with_real_workspace(dagger_client):
+async def test_file_operations_with_real_workspace(workspace):
     """Test that FileOperations works with real workspace."""
-    workspace = await Workspace.create(dagger_client)
     file_ops = FileOperations(workspace)
     
     # Create a file using FileOperations
     file_ops.workspace = file_ops.workspace.write_file("test.txt", "test content")
     
-    # Verify file was created
-    files = await file_ops.workspace.ls(".")
+    # Verify file was created (independent reads, sent to the engine together)
+    files, content = await asyncio.gather(
+        file_ops.workspace.ls("."),
+        file_ops.workspace.read_file("test.txt"),
+    )
     assert "test.txt" in files
-    
-    content = await file_ops.workspace.read_file("test.txt")
     assert content == "test content"
-    
-    print("✅ FileOperations works with real workspace")
 
 
 @pytest.mark.asyncio
-async def test_file_operations_multiple_file_operations(dagger_client):
+async def test_file_operations_multiple_file_operations(workspace):
     """Test that FileOperations can handle multiple file operations."""
-    workspace = await Workspace.create(dagger_client)
     file_ops = FileOperations(workspace)
     
     # Create multiple files
@@ -101,18 +92,23 @@ async def test_file_operations_multiple_file_operations(dagger_client):
     file_ops.workspace = file_ops.workspace.write_file("file2.txt", "content2")
     file_ops.workspace = file_ops.workspace.write_file("file3.txt", "content3")
     
+    # Read the listing and all contents at once (independent reads)
+    files, content1, content2, content3 = await asyncio.gather(
+        file_ops.workspace.ls("."),
+        file_ops.workspace.read_file("file1.txt"),
+        file_ops.workspace.read_file("file2.txt"),
+        file_ops.workspace.read_file("file3.txt"),
+    )
+    
     # Verify all files exist
-    files = await file_ops.workspace.ls(".")
     assert "file1.txt" in files
     assert "file2.txt" in files
     assert "file3.txt" in files
     
     # Verify contents
-    assert await file_ops.workspace.read_file("file1.txt") == "content1"
-    assert await file_ops.workspace.read_file("file2.txt") == "content2"
-    assert await file_ops.workspace.read_file("file3.txt") == "content3"
-    
-    print("✅ FileOperations handles multiple file operations")
+    assert content1 == "content1"
+    assert content2 == "content2"
+    assert content3 == "content3"
 
 
 # ============================================================================
@@ -120,10 +116,9 @@ async def test_file_operations_multiple_file_operations(dagger_client):
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_graph_with_asset_context(dagger_client):
+async def test_graph_with_asset_context(workspace):
     """Test that graph can be created with asset context."""
     llm_client = Mock(spec=LLMClient)
-    workspace = await Workspace.create(dagger_client)
     file_ops = FileOperations(workspace)
     
     graph = create_agent_graph(llm_client, file_ops)
@@ -143,15 +138,12 @@ async def test_graph_with_asset_context(dagger_client):
     # Verify state structure is valid
     assert "asset_context" in state
     assert "car.png" in state["asset_context"]
-    
-    print("✅ Graph handles asset context in state")
 
 
 @pytest.mark.asyncio
-async def test_graph_with_sound_context(dagger_client):
+async def test_graph_with_sound_context(workspace):
     """Test that graph can be created with sound context."""
     llm_client = Mock(spec=LLMClient)
-    workspace = await Workspace.create(dagger_client)
     file_ops = FileOperations(workspace)
     
     graph = create_agent_graph(llm_client, file_ops)
@@ -171,15 +163,12 @@ async def test_graph_with_sound_context(dagger_client):
     # Verify state structure is valid
     assert "sound_context" in state
     assert "engine.mp3" in state["sound_context"]
-    
-    print("✅ Graph handles sound context in state")
 
 
 @pytest.mark.asyncio
-async def test_graph_feedback_mode_state(dagger_client):
+async def test_graph_feedback_mode_state(workspace):
     """Test that graph can handle feedback mode state."""
     llm_client = Mock(spec=LLMClient)
-    workspace = await Workspace.create(dagger_client)
     file_ops = FileOperations(workspace)
     
     graph = create_agent_graph(llm_client, file_ops)
@@ -205,8 +194,6 @@ async def test_graph_feedback_mode_state(dagger_client):
     assert state["retry_count"] > 0
     assert len(state["test_failures"]) > 0
     assert "original_prompt" in state
-    
-    print("✅ Graph handles feedback mode state")
 
 
 # ============================================================================
@@ -214,9 +201,8 @@ async def test_graph_feedback_mode_state(dagger_client):
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_workspace_state_persistence(dagger_client):
+async def test_workspace_state_persistence(workspace):
     """Test that workspace changes persist in state."""
-    workspace = await Workspace.create(dagger_client)
     
     # Create initial file
     workspace = workspace.write_file("initial.txt", "initial content")
@@ -232,8 +218,6 @@ async def test_workspace_state_persistence(dagger_client):
     files = await workspace.ls(".")
     assert "initial.txt" in files
     assert "second.txt" in files
-    
-    print("✅ Workspace state persists across operations")
 
 
 # ============================================================================
@@ -258,8 +242,6 @@ def test_message_types_compatibility():
     # Verify tool calls structure
     assert len(messages[2].tool_calls) == 1
     assert messages[2].tool_calls[0]["name"] == "create_file"
-    
-    print("✅ Multiple message types work correctly")
 
 
 # ============================================================================
@@ -267,10 +249,9 @@ def test_message_types_compatibility():
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_graph_handles_missing_optional_context(dagger_client):
+async def test_graph_handles_missing_optional_context(workspace):
     """Test that graph works without optional asset/sound context."""
     llm_client = Mock(spec=LLMClient)
-    workspace = await Workspace.create(dagger_client)
     file_ops = FileOperations(workspace)
     
     graph = create_agent_graph(llm_client, file_ops)
@@ -292,8 +273,6 @@ async def test_graph_handles_missing_optional_context(dagger_client):
     assert "sound_context" not in state
     assert "messages" in state
     assert "workspace" in state
-    
-    print("✅ Graph handles missing optional context")
 
 
 # ============================================================================
@@ -322,8 +301,6 @@ def test_retry_count_state_transitions():
     state["test_failures"] = []
     assert state["retry_count"] == 0
     assert len(state["test_failures"]) == 0
-    
-    print("✅ Retry count transitions work correctly")
 
 
 def test_max_retries_limit():
@@ -340,5 +317,3 @@ def test_max_retries_limit():
     state["retry_count"] = 3
     can_continue = state["retry_count"] <= MAX_RETRIES
     assert can_continue is True
-    
-    print("✅ Max retries limit enforced")
@@ -59,6 +59,15 @@ def extract_code_examples(prompt_text: str) -> dict:
     return examples
 
 
+# Minimal valid 1x1 red pixel PNG
+RED_PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a"  # signature
+    "0000000d4948445200000001000000010802000000907753de"  # IHDR
+    "0000000c49444154089963f8cfc00000000300015ccdff1c"  # IDAT
+    "0000000049454e44ae426082"  # IEND
+)
+
+
 @pytest.fixture
 async def asset_workspace(dagger_client, tmp_path):
     """Create a workspace with test assets."""
@@ -66,24 +75,10 @@ async def asset_workspace(dagger_client, tmp_path):
     assets_dir = tmp_path / "assets"
     assets_dir.mkdir()
     
-    # Create a simple test image (1x1 red pixel PNG)
-    # This is a valid minimal PNG file
-    red_pixel_png = bytes([
-        0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-        0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
-        0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,  # 1x1 dimensions
-        0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
-        0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,  # IDAT chunk
-        0x54, 0x08, 0x99, 0x63, 0xF8, 0xCF, 0xC0, 0x00,
-        0x00, 0x00, 0x03, 0x00, 0x01, 0x5C, 0xCD, 0xFF,
-        0x1C, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,  # IEND chunk
-        0x44, 0xAE, 0x42, 0x60, 0x82
-    ])
-    
     # Create test assets
-    (assets_dir / "test_car.png").write_bytes(red_pixel_png)
-    (assets_dir / "test_rock.png").write_bytes(red_pixel_png)
-    (assets_dir / "test_road.png").write_bytes(red_pixel_png)
+    (assets_dir / "test_car.png").write_bytes(RED_PIXEL_PNG)
+    (assets_dir / "test_rock.png").write_bytes(RED_PIXEL_PNG)
+    (assets_dir / "test_road.png").write_bytes(RED_PIXEL_PNG)
     
     # Create workspace with assets
     workspace = await Workspace.create(
@@ -108,7 +108,7 @@ async def test_full_screenshot_to_vlm_flow(dagger_client, playwright_container):
     try:
         vlm_client = VLMClient()
         
-        is_valid, reason = validate_playable_with_vlm(
+        is_valid, reason = await validate_playable_with_vlm(
             vlm_client=vlm_client,
             screenshot_bytes=test_result.screenshot_bytes,
             console_logs=test_result.console_logs,
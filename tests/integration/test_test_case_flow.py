@@ -202,10 +202,10 @@ async def test_test_case_validation_with_mock_vlm(dagger_client, playwright_cont
     # Mock VLM response
     mock_response = Mock()
     mock_response.text = "<reason>State correctly shows Test State</reason><answer>yes</answer>"
-    mock_vlm_client.model.generate_content = Mock(return_value=mock_response)
+    mock_vlm_client.model.generate_content_async = AsyncMock(return_value=mock_response)
     
     # Call validate_test_case_with_vlm
-    is_valid, reason = validate_test_case_with_vlm(
+    is_valid, reason = await validate_test_case_with_vlm(
         vlm_client=mock_vlm_client,
         screenshot_bytes=result.screenshot_bytes,
         expected_output="State shows Test State",
@@ -218,7 +218,7 @@ async def test_test_case_validation_with_mock_vlm(dagger_client, playwright_cont
     assert "correctly" in reason.lower(), "Should extract reason from VLM response"
     
     # Verify VLM was called
-    assert mock_vlm_client.model.generate_content.called, "VLM should be called"
+    assert mock_vlm_client.model.generate_content_async.called, "VLM should be called"
     
     print(f"\n✅ Test case VLM integration works")
     print(f"   VLM validated: {is_valid}")
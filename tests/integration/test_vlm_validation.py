@@ -41,7 +41,7 @@ async def test_vlm_validation_with_real_screenshot():
     user_prompt = "Create a simple red screen test"
     
     # Run validation
-    is_valid, reason = validate_playable_with_vlm(
+    is_valid, reason = await validate_playable_with_vlm(
         vlm_client=vlm_client,
         screenshot_bytes=screenshot_bytes,
         console_logs=console_logs,
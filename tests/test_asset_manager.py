@@ -27,6 +27,15 @@ from src.asset_manager import (
 )
 
 
+# Minimal valid 1x1 red pixel PNG
+RED_PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a"  # signature
+    "0000000d4948445200000001000000010802000000907753de"  # IHDR
+    "0000000c49444154089963f8cfc00000000300015ccdff1c"  # IDAT
+    "0000000049454e44ae426082"  # IEND
+)
+
+
 class TestAssetPackDiscovery:
     """Test asset pack listing functionality."""
     
@@ -82,21 +91,8 @@ class TestImageDimensions:
     
     def test_get_image_dimensions(self, tmp_path):
         """Test getting dimensions of a real PNG image."""
-        # Create a minimal 1x1 red pixel PNG
-        png_data = bytes([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,
-            0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,
-            0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
-            0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
-            0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,
-            0x54, 0x08, 0x99, 0x63, 0xF8, 0xCF, 0xC0, 0x00,
-            0x00, 0x00, 0x03, 0x00, 0x01, 0x5C, 0xCD, 0xFF,
-            0x1C, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,
-            0x44, 0xAE, 0x42, 0x60, 0x82
-        ])
-        
         image_path = tmp_path / "test.png"
-        image_path.write_bytes(png_data)
+        image_path.write_bytes(RED_PIXEL_PNG)
         
         width, height = get_image_dimensions(image_path)
         assert width == 1
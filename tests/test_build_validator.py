@@ -8,6 +8,16 @@ from src.validators.build_validator import validate_build
 from src.validators.base import ValidationResult
 
 
+def _mock_file_listing(workspace, root_files, dist_files):
+    """Mock workspace.ls over the given workspace root and dist/ listings."""
+    async def ls(path):
+        # Directory entries are top-level only; subdirectories end with "/"
+        files = dist_files if path == "dist" else root_files
+        return list(dict.fromkeys(f.split("/")[0] + "/" if "/" in f else f for f in files))
+    
+    workspace.ls = AsyncMock(side_effect=ls)
+
+
 @pytest.mark.asyncio
 async def test_validate_build_success():
     """Test successful build with all checks passing."""
@@ -27,12 +37,12 @@ async def test_validate_build_success():
     
     # Mock workspace operations
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
-    workspace.ls = AsyncMock(side_effect=[
+    _mock_file_listing(
+        workspace,
         ["config.json", "MANIFEST.json", "test_case_1.json", "test_case_2.json", "src/"],
-        ["bundle.html", "config.json", "MANIFEST.json", "test_case_1.json", "test_case_2.json"]
-    ])
-    workspace.read_file = AsyncMock(return_value="file content")
-    workspace.write_file = Mock(return_value=workspace)
+        ["bundle.html", "config.json", "MANIFEST.json", "test_case_1.json", "test_case_2.json"],
+    )
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation
     result = await validate_build(workspace, retry_count=0)
@@ -48,14 +58,18 @@ async def test_validate_build_success():
     workspace.exec.assert_any_call(["npx", "tsc", "--noEmit"])
     # Verify build was called
     workspace.exec.assert_any_call(["npm", "run", "build"])
-    # Verify files were copied
-    assert workspace.write_file.call_count >= 5  # config, MANIFEST, 2 test cases, index.html
+    # Verify files were copied inside the container
+    workspace.exec_mut.assert_any_call(
+        ["cp", "config.json", "MANIFEST.json", "test_case_1.json", "test_case_2.json", "dist/"]
+    )
+    workspace.exec_mut.assert_any_call(["cp", "dist/bundle.html", "dist/index.html"])
 
 
 @pytest.mark.asyncio
 async def test_validate_build_type_check_fails():
     """Test build fails when TypeScript type check fails."""
     workspace = Mock()
+    _mock_file_listing(workspace, ["config.json", "MANIFEST.json", "test_case_1.json"], [])
     
     # Mock failed type check
     type_check_result = Mock()
@@ -84,6 +98,7 @@ async def test_validate_build_type_check_fails():
 async def test_validate_build_build_fails():
     """Test build fails when npm run build fails."""
     workspace = Mock()
+    _mock_file_listing(workspace, ["config.json", "MANIFEST.json", "test_case_1.json"], [])
     
     # Mock successful type check
     type_check_result = Mock()
@@ -121,9 +136,8 @@ async def test_validate_build_no_test_cases():
     
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
     # Mock workspace with no test case files
-    workspace.ls = AsyncMock(return_value=["config.json", "MANIFEST.json", "src/"])
-    workspace.read_file = AsyncMock(return_value="file content")
-    workspace.write_file = Mock(return_value=workspace)
+    _mock_file_listing(workspace, ["config.json", "MANIFEST.json", "src/"], [])
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation
     result = await validate_build(workspace, retry_count=0)
@@ -133,6 +147,9 @@ async def test_validate_build_no_test_cases():
     assert "No test cases found" in result.error_message
     assert result.failures == ["No test cases found"]
     assert result.retry_count == 1
+    
+    # Type check and build should be skipped entirely
+    workspace.exec.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -145,12 +162,12 @@ async def test_validate_build_no_html_output():
     build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
     
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
-    workspace.ls = AsyncMock(side_effect=[
+    _mock_file_listing(
+        workspace,
         ["config.json", "MANIFEST.json", "test_case_1.json", "src/"],
-        ["config.json", "MANIFEST.json", "test_case_1.json"]  # No HTML files
-    ])
-    workspace.read_file = AsyncMock(return_value="file content")
-    workspace.write_file = Mock(return_value=workspace)
+        ["config.json", "MANIFEST.json", "test_case_1.json"],  # No HTML files
+    )
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation
     result = await validate_build(workspace, retry_count=0)
@@ -172,12 +189,12 @@ async def test_validate_build_multiple_html_files():
     build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
     
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
-    workspace.ls = AsyncMock(side_effect=[
+    _mock_file_listing(
+        workspace,
         ["config.json", "MANIFEST.json", "test_case_1.json", "src/"],
-        ["bundle1.html", "bundle2.html", "config.json"]  # Multiple HTML files
-    ])
-    workspace.read_file = AsyncMock(return_value="file content")
-    workspace.write_file = Mock(return_value=workspace)
+        ["bundle1.html", "bundle2.html", "config.json"],  # Multiple HTML files
+    )
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation
     result = await validate_build(workspace, retry_count=2)
@@ -201,16 +218,16 @@ async def test_validate_build_copies_all_test_cases():
     build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
     
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
-    workspace.ls = AsyncMock(side_effect=[
+    _mock_file_listing(
+        workspace,
         [
             "config.json", "MANIFEST.json",
             "test_case_1.json", "test_case_2.json", "test_case_3.json",
             "test_case_4.json", "test_case_5.json", "src/"
         ],
-        ["output.html"]
-    ])
-    workspace.read_file = AsyncMock(return_value="file content")
-    workspace.write_file = Mock(return_value=workspace)
+        ["output.html"],
+    )
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation
     result = await validate_build(workspace, retry_count=0)
@@ -218,14 +235,12 @@ async def test_validate_build_copies_all_test_cases():
     # Assertions
     assert result.passed is True
     
-    # Verify all test cases were copied
-    # Should have: config.json, MANIFEST.json, test_case_1-5 (7 files), plus index.html = 8 total
-    assert workspace.write_file.call_count == 8
-    
-    # Verify specific test cases were copied
-    calls = [str(call) for call in workspace.write_file.call_args_list]
+    # Verify all test cases were copied in a single cp
+    copy_command = workspace.exec_mut.call_args_list[0][0][0]
+    assert copy_command[:3] == ["cp", "config.json", "MANIFEST.json"]
+    assert copy_command[-1] == "dist/"
     for i in range(1, 6):
-        assert any(f"test_case_{i}.json" in call for call in calls)
+        assert f"test_case_{i}.json" in copy_command
 
 
 @pytest.mark.asyncio
@@ -238,20 +253,22 @@ async def test_validate_build_partial_test_cases():
     build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
     
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
-    workspace.ls = AsyncMock(side_effect=[
+    _mock_file_listing(
+        workspace,
         ["config.json", "MANIFEST.json", "test_case_1.json", "test_case_2.json", "src/"],
-        ["output.html"]
-    ])
-    workspace.read_file = AsyncMock(return_value="file content")
-    workspace.write_file = Mock(return_value=workspace)
+        ["output.html"],
+    )
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation
     result = await validate_build(workspace, retry_count=0)
     
     # Assertions
     assert result.passed is True
-    # Should copy: config.json, MANIFEST.json, test_case_1, test_case_2, index.html = 5 files
-    assert workspace.write_file.call_count == 5
+    # Should copy: config.json, MANIFEST.json, test_case_1, test_case_2
+    workspace.exec_mut.assert_any_call(
+        ["cp", "config.json", "MANIFEST.json", "test_case_1.json", "test_case_2.json", "dist/"]
+    )
 
 
 @pytest.mark.asyncio
@@ -264,20 +281,13 @@ async def test_validate_build_creates_index_html():
     build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
     
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
-    workspace.ls = AsyncMock(side_effect=[
+    _mock_file_listing(
+        workspace,
         ["config.json", "MANIFEST.json", "test_case_1.json"],
-        ["Playable_Template_v1_20231025_Preview.html"]
-    ])
-    
-    html_content = "<html><body>Game</body></html>"
-    
-    def read_file_side_effect(path):
-        if path == "dist/Playable_Template_v1_20231025_Preview.html":
-            return html_content
-        return "other content"
+        ["Playable_Template_v1_20231025_Preview.html"],
+    )
     
-    workspace.read_file = AsyncMock(side_effect=read_file_side_effect)
-    workspace.write_file = Mock(return_value=workspace)
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation
     result = await validate_build(workspace, retry_count=0)
@@ -285,17 +295,62 @@ async def test_validate_build_creates_index_html():
     # Assertions
     assert result.passed is True
     
-    # Verify index.html was created with the right content
-    calls = workspace.write_file.call_args_list
-    index_html_call = [call for call in calls if "dist/index.html" in str(call)]
-    assert len(index_html_call) == 1
-    assert index_html_call[0][0][1] == html_content  # Check content matches
+    # Verify the built HTML was copied to index.html
+    workspace.exec_mut.assert_any_call(
+        ["cp", "dist/Playable_Template_v1_20231025_Preview.html", "dist/index.html"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_build_copy_fails():
+    """Test build fails when critical files can't be copied into dist/."""
+    workspace = Mock()
+    
+    type_check_result = Mock(exit_code=0, stdout="")
+    build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
+    
+    workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
+    _mock_file_listing(workspace, ["MANIFEST.json", "test_case_1.json"], ["output.html"])
+    workspace.exec_mut = AsyncMock(return_value=Mock(
+        exit_code=1, stdout="", stderr="cp: can't stat 'config.json': No such file or directory"
+    ))
+    
+    result = await validate_build(workspace, retry_count=0)
+    
+    assert result.passed is False
+    assert "config.json" in result.error_message
+    assert result.retry_count == 1
+
+
+@pytest.mark.asyncio
+async def test_validate_build_index_copy_fails():
+    """Test build fails when the built HTML can't be copied to dist/index.html."""
+    workspace = Mock()
+    
+    type_check_result = Mock(exit_code=0, stdout="")
+    build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
+    
+    workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
+    _mock_file_listing(workspace, ["config.json", "MANIFEST.json", "test_case_1.json"], ["output.html"])
+    workspace.exec_mut = AsyncMock(side_effect=[
+        Mock(exit_code=0, stdout="", stderr=""),
+        Mock(exit_code=1, stdout="", stderr="cp: can't create 'dist/index.html': Permission denied"),
+    ])
+    
+    result = await validate_build(workspace, retry_count=0)
+    
+    assert result.passed is False
+    assert "dist/index.html" in result.error_message
+    assert "Permission denied" in result.failures[0]
+    assert result.retry_count == 1
+    assert result.workspace is None
 
 
 @pytest.mark.asyncio
 async def test_validate_build_retry_count_increments():
     """Test that retry count increments correctly on failures."""
     workspace = Mock()
+    _mock_file_listing(workspace, ["config.json", "MANIFEST.json", "test_case_1.json"], [])
     
     # Mock failed type check
     type_check_result = Mock()
@@ -322,12 +377,12 @@ async def test_validate_build_retry_count_resets_on_success():
     build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
     
     workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
-    workspace.ls = AsyncMock(side_effect=[
+    _mock_file_listing(
+        workspace,
         ["config.json", "MANIFEST.json", "test_case_1.json"],
-        ["output.html"]
-    ])
-    workspace.read_file = AsyncMock(return_value="content")
-    workspace.write_file = Mock(return_value=workspace)
+        ["output.html"],
+    )
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
     
     # Run validation with existing retry count
     result = await validate_build(workspace, retry_count=3)
@@ -336,3 +391,25 @@ async def test_validate_build_retry_count_resets_on_success():
     assert result.passed is True
     assert result.retry_count == 0  # Reset to 0 on success
 
+
+
+@pytest.mark.asyncio
+async def test_validate_build_ignores_nested_html_files():
+    """Test that HTML files in dist/ subdirectories don't count as build output."""
+    workspace = Mock()
+    
+    type_check_result = Mock(exit_code=0, stdout="")
+    build_result = Mock(exit_code=0, stdout="Build completed", stderr="")
+    
+    workspace.exec = AsyncMock(side_effect=[type_check_result, build_result])
+    _mock_file_listing(
+        workspace,
+        ["config.json", "MANIFEST.json", "test_case_1.json"],
+        ["output.html", "assets/credits.html"],
+    )
+    workspace.exec_mut = AsyncMock(return_value=Mock(exit_code=0, stdout="", stderr=""))
+    
+    result = await validate_build(workspace, retry_count=0)
+    
+    assert result.passed is True
+    workspace.exec_mut.assert_any_call(["cp", "dist/output.html", "dist/index.html"])
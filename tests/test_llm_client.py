@@ -538,6 +538,50 @@ def test_call_adds_cache_control_to_system(llm_client):
     assert system_arg[0]["cache_control"] == {"type": "ephemeral"}
 
 
+def test_call_passes_system_blocks_through(llm_client):
+    """Test that a pre-built list of system blocks is sent unchanged."""
+    mock_response = Mock()
+    mock_response.usage.input_tokens = 100
+    mock_response.usage.output_tokens = 50
+    mock_response.content = []
+    
+    llm_client.client.messages.create = Mock(return_value=mock_response)
+    
+    system_blocks = [
+        {"type": "text", "text": "System prompt", "cache_control": {"type": "ephemeral"}}
+    ]
+    
+    llm_client.call(
+        messages=[HumanMessage(content="Test")],
+        tools=[],
+        system=system_blocks,
+        max_tokens=1000
+    )
+    
+    call_args = llm_client.client.messages.create.call_args
+    assert call_args.kwargs['system'] == system_blocks
+
+
+async def test_acall_delegates_to_call(llm_client):
+    """Test that acall runs the synchronous call and returns its response."""
+    mock_response = Mock()
+    mock_response.usage.input_tokens = 100
+    mock_response.usage.output_tokens = 50
+    mock_response.content = []
+    
+    llm_client.client.messages.create = Mock(return_value=mock_response)
+    
+    response = await llm_client.acall(
+        messages=[HumanMessage(content="Test")],
+        tools=[],
+        system="System",
+        max_tokens=1000
+    )
+    
+    assert response is mock_response
+    llm_client.client.messages.create.assert_called_once()
+
+
 def test_call_adds_cache_control_to_tools(llm_client):
     """Test that cache_control is added to last tool."""
     mock_response = Mock()
@@ -6,6 +6,12 @@ import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from src.validators.playable_validator import validate_playable
 from src.validators.base import ValidationResult
+from src.vlm.prompts import (
+    VLM_PLAYABLE_VALIDATION_PROMPT,
+    VLM_PLAYABLE_NORMAL_PROMPT,
+    VLM_PLAYABLE_FEEDBACK_PROMPT
+)
+from jinja2 import Template
 
 
 @pytest.mark.asyncio
@@ -53,7 +59,8 @@ async def test_validate_playable_success():
     # Verify container was reset and prepared
     playwright_container.reset.assert_called_once()
     playwright_container.copy_directory.assert_called_once()
-    playwright_container.with_test_script.assert_called_once()
+    # TEST_SCRIPT is baked into the container, not written per validation
+    playwright_container.with_test_script.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -178,6 +185,7 @@ async def test_validate_playable_feedback_mode():
     call_kwargs = mock_vlm.call_args[1]
     assert call_kwargs['is_feedback_mode'] is True
     assert call_kwargs['original_prompt'] == "Create a racing game"
+    assert call_kwargs['template_str'] == VLM_PLAYABLE_FEEDBACK_PROMPT
 
 
 @pytest.mark.asyncio
@@ -294,3 +302,29 @@ async def test_validate_playable_console_logs_formatting():
     assert "[ERROR] Failed to load asset" in result.error_message
     assert "[WARNING] Performance issue" in result.error_message
 
+
+
+def test_render_validation_failed_matches_template_format():
+    """Test that the pre-split template renders the same as str.format."""
+    from src.prompts import FEEDBACK_VALIDATION_FAILED
+    from src.validators.playable_validator import _render_validation_failed
+    
+    reason = "Score {not} updating"
+    console_logs = "  [LOG] a\n  [ERROR] b"
+    
+    assert _render_validation_failed(reason, console_logs) == FEEDBACK_VALIDATION_FAILED.format(
+        reason=reason,
+        console_logs=console_logs
+    )
+
+
+@pytest.mark.parametrize("is_feedback_mode", [False, True])
+def test_playable_prompt_variants_match_combined_template(is_feedback_mode):
+    """Test that the per-mode playable prompts render like the combined template."""
+    context = {"user_prompt": "Make it faster", "original_prompt": "Create a racing game", "console_logs": "Game loaded"}
+    variant = VLM_PLAYABLE_FEEDBACK_PROMPT if is_feedback_mode else VLM_PLAYABLE_NORMAL_PROMPT
+    
+    expected = Template(VLM_PLAYABLE_VALIDATION_PROMPT).render(is_feedback_mode=is_feedback_mode, **context)
+    
+    assert "{% if" not in variant
+    assert Template(variant).render(**context) == expected
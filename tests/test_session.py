@@ -21,9 +21,11 @@ from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 
 from src.session import (
     Session,
+    COMPRESSION_THRESHOLD,
     generate_session_id,
     create_session,
     save_session,
+    append_iteration,
     load_session,
     list_sessions,
     get_session_path,
@@ -177,6 +179,24 @@ def test_session_from_dict_with_missing_optional_fields():
     assert session.game_designer_output is None
 
 
+def test_session_from_dict_interns_message_types():
+    """Test that message types decoded from JSON share a single string object."""
+    data = json.loads(json.dumps({
+        "session_id": "test",
+        "initial_prompt": "Test",
+        "created_at": "2025-01-01T00:00:00",
+        "last_modified": "2025-01-01T00:00:00",
+        "message_history": [
+            {"type": "HumanMessage", "content": "a"},
+            {"type": "HumanMessage", "content": "b"}
+        ]
+    }))
+    
+    session = Session.from_dict(data)
+    
+    assert session.message_history[0]["type"] is session.message_history[1]["type"]
+
+
 def test_session_serialization_roundtrip(sample_session):
     """Test that to_dict/from_dict is reversible."""
     data = sample_session.to_dict()
@@ -367,6 +387,27 @@ def test_save_graph_state():
     assert "extra_field" not in session.graph_state
 
 
+def test_save_graph_state_copies_test_failures():
+    """Test that saved and retrieved test failures don't share lists with the caller."""
+    session = Session(
+        session_id="test",
+        initial_prompt="Test",
+        created_at="2025-01-01T00:00:00",
+        last_modified="2025-01-01T00:00:00"
+    )
+    
+    state = {"test_failures": ["error1"]}
+    session.save_graph_state(state)
+    state["test_failures"].append("error2")
+    
+    assert session.graph_state["test_failures"] == ["error1"]
+    
+    restored = session.get_graph_state()
+    restored["test_failures"].append("error3")
+    
+    assert session.graph_state["test_failures"] == ["error1"]
+
+
 def test_save_graph_state_with_defaults():
     """Test saving graph state with missing fields."""
     session = Session(
@@ -517,6 +558,17 @@ def test_save_session_creates_file(temp_base_path, sample_session):
     assert session_file.exists()
 
 
+def test_save_session_leaves_no_temp_file(temp_base_path, sample_session):
+    """Test that save_session replaces session.json atomically without leftovers."""
+    session_dir = temp_base_path / sample_session.session_id
+    session_dir.mkdir(parents=True)
+    
+    save_session(sample_session, base_path=temp_base_path)
+    save_session(sample_session, base_path=temp_base_path)
+    
+    assert sorted(p.name for p in session_dir.iterdir()) == ["session.json"]
+
+
 def test_save_session_content(temp_base_path, sample_session):
     """Test that saved session has correct JSON content."""
     session_dir = temp_base_path / sample_session.session_id
@@ -533,6 +585,69 @@ def test_save_session_content(temp_base_path, sample_session):
     assert data["status"] == "completed"
 
 
+def test_save_session_compresses_large_history(temp_base_path, sample_session):
+    """Test that large sessions are stored as zstd-compressed session.json.zst."""
+    session_dir = temp_base_path / sample_session.session_id
+    session_dir.mkdir(parents=True)
+    
+    # Start with a small session so a plain session.json exists
+    save_session(sample_session, base_path=temp_base_path)
+    assert (session_dir / "session.json").exists()
+    
+    sample_session.message_history = [
+        {"type": "AIMessage", "content": "x" * 1024} for _ in range(COMPRESSION_THRESHOLD // 1024 + 1)
+    ]
+    save_session(sample_session, base_path=temp_base_path)
+    
+    assert (session_dir / "session.json.zst").exists()
+    assert not (session_dir / "session.json").exists()
+    
+    loaded = load_session(sample_session.session_id, base_path=temp_base_path)
+    assert loaded is not None
+    assert loaded.message_history == sample_session.message_history
+    assert list_sessions(base_path=temp_base_path)[0].session_id == sample_session.session_id
+
+
+def test_append_iteration_replayed_on_load(temp_base_path, sample_session):
+    """Test that appended iterations survive a reload without a full save."""
+    session_dir = temp_base_path / sample_session.session_id
+    session_dir.mkdir(parents=True)
+    save_session(sample_session, base_path=temp_base_path)
+    
+    append_iteration(sample_session, "Add more cars", "2025-11-16T16:00:00", base_path=temp_base_path)
+    append_iteration(sample_session, "Add sounds", "2025-11-16T17:00:00", base_path=temp_base_path)
+    
+    assert (session_dir / "iterations.ndjson").exists()
+    loaded = load_session(sample_session.session_id, base_path=temp_base_path)
+    assert loaded.iterations == sample_session.iterations
+    assert len(loaded.iterations) == 3
+    assert loaded.last_modified == "2025-11-16T17:00:00"
+    
+    # A full save compacts the log into the session file
+    save_session(loaded, base_path=temp_base_path)
+    assert not (session_dir / "iterations.ndjson").exists()
+    reloaded = load_session(sample_session.session_id, base_path=temp_base_path)
+    assert reloaded.iterations == sample_session.iterations
+
+
+def test_iterations_log_left_after_save_not_replayed_twice(temp_base_path, sample_session):
+    """Test that a log left behind by a crash after the snapshot was saved doesn't duplicate iterations."""
+    session_dir = temp_base_path / sample_session.session_id
+    session_dir.mkdir(parents=True)
+    save_session(sample_session, base_path=temp_base_path)
+    
+    append_iteration(sample_session, "Add more cars", "2025-11-16T16:00:00", base_path=temp_base_path)
+    log_contents = (session_dir / "iterations.ndjson").read_bytes()
+    
+    # Crash between replacing the snapshot and unlinking the log
+    save_session(sample_session, base_path=temp_base_path)
+    (session_dir / "iterations.ndjson").write_bytes(log_contents)
+    
+    loaded = load_session(sample_session.session_id, base_path=temp_base_path)
+    assert loaded.iterations == sample_session.iterations
+    assert len(loaded.iterations) == 2
+
+
 def test_load_session_success(temp_base_path, sample_session):
     """Test loading session from file."""
     session_dir = temp_base_path / sample_session.session_id
@@ -641,6 +756,31 @@ def test_list_sessions_respects_limit(temp_base_path):
     assert len(sessions) == 3
 
 
+def test_list_sessions_skips_corrupted_sessions_within_limit(temp_base_path):
+    """Test that corrupted session files don't reduce the number of returned sessions."""
+    temp_base_path.mkdir(parents=True)
+    
+    for i in range(5):
+        session_id = f"20251116_10000{i}_test{i:04d}"
+        session_dir = temp_base_path / session_id
+        session_dir.mkdir(parents=True)
+        if i >= 3:
+            # Newest sessions are corrupted
+            (session_dir / "session.json").write_text("{ invalid json }", encoding="utf-8")
+            continue
+        session = Session(
+            session_id=session_id,
+            initial_prompt=f"Prompt {i}",
+            created_at="2025-11-16T00:00:00",
+            last_modified="2025-11-16T00:00:00"
+        )
+        save_session(session, base_path=temp_base_path)
+    
+    sessions = list_sessions(base_path=temp_base_path, limit=2)
+    
+    assert [s.initial_prompt for s in sessions] == ["Prompt 2", "Prompt 1"]
+
+
 def test_list_sessions_skips_invalid_directories(temp_base_path):
     """Test that list_sessions skips directories without session.json."""
     temp_base_path.mkdir(parents=True)
@@ -6,7 +6,15 @@ import pytest
 import json
 from test_game import validate_game_with_test_case, TEST_SCRIPT_WITH_TEST_CASE
 from src.containers import Workspace
-from src.vlm.validation import _save_debug_screenshot, _parse_vlm_response
+from src.vlm.validation import (
+    _save_debug_screenshot, _save_test_case_json, _parse_vlm_response, _debug_writer,
+    _get_test_run_dir, validate_test_case_with_vlm, validate_test_cases_with_vlm, save_test_case_error
+)
+from src.vlm.cache import get_cached_response, cache_response
+from src.vlm.client import VLMClient, get_template, render_prompt, image_part, MAX_IMAGE_SIDE
+from unittest.mock import Mock, AsyncMock, patch
+from PIL import Image
+import io
 from pathlib import Path
 import tempfile
 import shutil
@@ -330,6 +338,301 @@ def test_parse_vlm_response_invalid_format():
     print(f"   Reason: {reason[:100]}")
 
 
+def test_parse_vlm_response_tag_edge_cases():
+    """
+    Test multi-line reasons, padded answers and answers other than yes/no.
+    """
+    is_valid, reason = _parse_vlm_response("<reason>\n  Score is 10\n  Timer stopped\n</reason><answer> Yes\n</answer>")
+    assert is_valid is True
+    assert reason == "Score is 10\n  Timer stopped"
+
+    is_valid, reason = _parse_vlm_response("<reason>Unclear</reason><answer>maybe</answer>")
+    assert is_valid is False
+    assert "Invalid VLM response" in reason
+
+    # Unclosed reason tag falls back to the whole response
+    response_text = "<answer>no</answer><reason>Cut off"
+    assert _parse_vlm_response(response_text) == (False, response_text)
+
+
+@pytest.mark.asyncio
+async def test_vlm_client_validate_batch_splits_results():
+    """
+    Test that a batched VLM response is split back into per-case responses in order.
+    """
+    png = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(png, format="PNG")
+    
+    with patch("src.vlm.client.genai"):
+        vlm_client = VLMClient(api_key="test-key")
+    vlm_client.model = Mock()
+    # Results may come back out of order
+    vlm_client.model.generate_content_async = AsyncMock(return_value=Mock(text="""
+    <result id="2"><reason>Wrong score</reason><answer>no</answer></result>
+    <result id="1"><reason>Looks good</reason><answer>yes</answer></result>
+    """))
+    
+    responses = await vlm_client.validate_batch([png.getvalue(), png.getvalue()], ["prompt 1", "prompt 2"])
+    
+    vlm_client.model.generate_content_async.assert_awaited_once()
+    # Screenshots are sent as raw PNG bytes
+    contents = vlm_client.model.generate_content_async.call_args.args[0]
+    assert {"mime_type": "image/png", "data": png.getvalue()} in contents
+    assert [_parse_vlm_response(r) for r in responses] == [(True, "Looks good"), (False, "Wrong score")]
+
+
+def test_vlm_client_configures_genai_once_per_api_key():
+    """
+    Test that creating more VLM clients keeps the SDK's configured clients.
+    """
+    with patch("src.vlm.client._configured_api_key", None), patch("src.vlm.client.genai") as mock_genai:
+        VLMClient(api_key="key-1")
+        VLMClient(api_key="key-1")
+        assert mock_genai.configure.call_count == 1
+        
+        VLMClient(api_key="key-2")
+        assert mock_genai.configure.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_vlm_client_validate_batch_missing_result():
+    """
+    Test that a batched VLM response missing a case is rejected.
+    """
+    png = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(png, format="PNG")
+    
+    with patch("src.vlm.client.genai"):
+        vlm_client = VLMClient(api_key="test-key")
+    vlm_client.model = Mock()
+    vlm_client.model.generate_content_async = AsyncMock(return_value=Mock(
+        text='<result id="1"><reason>Looks good</reason><answer>yes</answer></result>'
+    ))
+    
+    with pytest.raises(ValueError):
+        await vlm_client.validate_batch([png.getvalue(), png.getvalue()], ["prompt 1", "prompt 2"])
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_with_vlm_only_sends_uncached_cases():
+    """
+    Test that test cases validated before are answered from the cache.
+    """
+    template_str = "Expected: {{ expected_output }}"
+    test_cases = [
+        {"screenshot_bytes": b"screenshot_1", "expected_output": "Score: 100",
+         "test_case_name": "test_case_1", "test_case_json": None},
+        {"screenshot_bytes": b"screenshot_2", "expected_output": "Game over",
+         "test_case_name": "test_case_2", "test_case_json": None},
+    ]
+    cache_response(b"screenshot_1", "Expected: Score: 100",
+                   "<reason>Score is 100</reason><answer>yes</answer>", ttl=60)
+    
+    vlm_client = Mock()
+    vlm_client.validate_batch = AsyncMock(return_value=["<reason>Still playing</reason><answer>no</answer>"])
+    
+    with patch("src.vlm.validation._save_debug_screenshot"):
+        results = await validate_test_cases_with_vlm(vlm_client, test_cases, template_str)
+    
+    assert results == [(True, "Score is 100"), (False, "Still playing")]
+    vlm_client.validate_batch.assert_called_once_with(
+        screenshots=[b"screenshot_2"], prompts=["Expected: Game over"]
+    )
+    # The new answer is cached for the next retry
+    assert get_cached_response(b"screenshot_2", "Expected: Game over") is not None
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_with_vlm_does_not_cache_malformed_responses():
+    """
+    Test that a response without a yes/no answer is not cached, so a retry asks again.
+    """
+    template_str = "Expected: {{ expected_output }}"
+    test_cases = [
+        {"screenshot_bytes": b"screenshot_1", "expected_output": "Score: 100",
+         "test_case_name": "test_case_1", "test_case_json": None},
+        {"screenshot_bytes": b"screenshot_2", "expected_output": "Game over",
+         "test_case_name": "test_case_2", "test_case_json": None},
+    ]
+    
+    vlm_client = Mock()
+    vlm_client.validate_batch = AsyncMock(return_value=[
+        "I am not sure what this shows",
+        "<reason>Game over screen</reason><answer>yes</answer>",
+    ])
+    
+    with patch("src.vlm.validation._save_debug_screenshot"):
+        results = await validate_test_cases_with_vlm(vlm_client, test_cases, template_str)
+    
+    assert results[0][0] is False
+    assert "Invalid VLM response format" in results[0][1]
+    assert results[1] == (True, "Game over screen")
+    assert get_cached_response(b"screenshot_1", "Expected: Score: 100") is None
+    assert get_cached_response(b"screenshot_2", "Expected: Game over") is not None
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_with_vlm_falls_back_to_single_requests():
+    """
+    Test that test cases are validated one request each if the batched request fails.
+    """
+    png = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(png, format="PNG")
+    test_cases = [
+        {"screenshot_bytes": png.getvalue(), "expected_output": f"State {i}",
+         "test_case_name": f"test_case_{i}", "test_case_json": None}
+        for i in (1, 2)
+    ]
+    
+    vlm_client = Mock(spec=VLMClient)
+    vlm_client.validate_batch = AsyncMock(side_effect=ValueError("Unparseable response"))
+    vlm_client.model = Mock()
+    vlm_client.model.generate_content_async = AsyncMock(
+        return_value=Mock(text="<reason>OK</reason><answer>yes</answer>")
+    )
+    
+    with patch("src.vlm.validation._save_debug_screenshot"):
+        results = await validate_test_cases_with_vlm(vlm_client, test_cases, "{{ expected_output }}")
+    
+    assert results == [(True, "OK"), (True, "OK")]
+    assert vlm_client.model.generate_content_async.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validate_test_case_with_vlm_writes_debug_files_in_background(tmp_path, monkeypatch):
+    """
+    Test that the debug screenshot and test case JSON are written by the background writer.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("src.vlm.validation._TEST_RUN_DIR_CACHE", {})
+    monkeypatch.setattr("src.vlm.validation._LAST_WRITTEN", {})
+    png = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(png, format="PNG")
+    vlm_client = Mock(spec=VLMClient)
+    vlm_client.model = Mock()
+    vlm_client.model.generate_content_async = AsyncMock(
+        return_value=Mock(text="<reason>OK</reason><answer>yes</answer>")
+    )
+
+    result = await validate_test_case_with_vlm(
+        vlm_client, png.getvalue(), "State 1", "{{ expected_output }}",
+        test_case_name="test_case_1", session_id="game", test_case_json='{"a": 1}', test_run_id="run"
+    )
+    # Wait for the queued writes to finish
+    _debug_writer.submit(lambda: None).result()
+
+    assert result == (True, "OK")
+    run_dir = tmp_path / "games" / "game" / "debug" / "run"
+    assert (run_dir / "test_case_1_screenshot.png").read_bytes() == png.getvalue()
+    assert (run_dir / "test_case_1.json").read_text() == '{"a": 1}'
+
+
+@pytest.mark.asyncio
+async def test_validate_test_case_with_vlm_skips_debug_files_when_disabled(monkeypatch):
+    """
+    Test that no debug files are written when PLAYABLE_DEBUG=0.
+    """
+    monkeypatch.setattr("src.vlm.validation._DEBUG_ENABLED", False)
+    png = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(png, format="PNG")
+    vlm_client = Mock(spec=VLMClient)
+    vlm_client.model = Mock()
+    vlm_client.model.generate_content_async = AsyncMock(
+        return_value=Mock(text="<reason>OK</reason><answer>yes</answer>")
+    )
+
+    with patch("src.vlm.validation._get_test_run_dir") as mock_run_dir, \
+         patch("src.vlm.validation._debug_writer") as mock_writer:
+        result = await validate_test_case_with_vlm(
+            vlm_client, png.getvalue(), "State 1", "{{ expected_output }}",
+            test_case_name="test_case_1", session_id="game", test_case_json='{"a": 1}'
+        )
+        save_test_case_error("test_case_1", "State 1", "State 2", "Failed", "game")
+
+    assert result == (True, "OK")
+    mock_writer.submit.assert_not_called()
+    mock_run_dir.assert_not_called()
+
+
+def test_save_test_case_json_skips_unchanged_content(tmp_path, monkeypatch):
+    """
+    Test that the same test case JSON is only written once per file.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("src.vlm.validation._TEST_RUN_DIR_CACHE", {})
+    monkeypatch.setattr("src.vlm.validation._LAST_WRITTEN", {})
+
+    with patch.object(Path, "write_bytes", autospec=True) as mock_write:
+        first = _save_test_case_json('{"a": 1}', "test_case_1", "game", "run")
+        second = _save_test_case_json('{"a": 1}', "test_case_1", "game", "run")
+        _save_test_case_json('{"a": 2}', "test_case_1", "game", "run")
+
+    assert first == second == Path("games") / "game" / "debug" / "run" / "test_case_1.json"
+    assert [c.args[1] for c in mock_write.call_args_list] == [b'{"a": 1}', b'{"a": 2}']
+
+
+def test_get_test_run_dir_creates_directory_once(tmp_path, monkeypatch):
+    """
+    Test that a test run directory is only created on first use.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("src.vlm.validation._TEST_RUN_DIR_CACHE", {})
+
+    with patch.object(Path, "mkdir") as mock_mkdir:
+        first = _get_test_run_dir("game", "run")
+        second = _get_test_run_dir("game", "run")
+        other = _get_test_run_dir("game", "other_run")
+
+    assert first is second
+    assert other == Path("games") / "game" / "debug" / "other_run"
+    assert mock_mkdir.call_count == 2
+
+
+def test_image_part_downscales_large_screenshots():
+    """
+    Test that large screenshots are downscaled to WebP and small ones are sent as-is.
+    """
+    small = io.BytesIO()
+    Image.new("RGB", (320, 240)).save(small, format="PNG")
+    small_bytes = small.getvalue()
+    # Small PNGs are passed through without copying or decoding
+    with patch("PIL.Image.open") as mock_open:
+        assert image_part(small_bytes)["data"] is small_bytes
+    mock_open.assert_not_called()
+    
+    large = io.BytesIO()
+    Image.new("RGB", (1280, 720)).save(large, format="PNG")
+    part = image_part(large.getvalue())
+    
+    assert part["mime_type"] == "image/webp"
+    downscaled = Image.open(io.BytesIO(part["data"]))
+    assert downscaled.size == (MAX_IMAGE_SIDE, 432)
+
+
+def test_get_template_compiles_once():
+    """
+    Test that prompt templates are compiled once per template string.
+    """
+    template = get_template("Expected: {{ expected_output }}")
+    
+    assert get_template("Expected: {{ expected_output }}") is template
+    assert template.render(expected_output="Score: 100") == "Expected: Score: 100"
+    assert render_prompt("Expected: {{ expected_output }}", expected_output="Score: 100") == "Expected: Score: 100"
+
+
+def test_vlm_cache_entry_expires():
+    """
+    Test that cached VLM responses expire after their TTL.
+    """
+    cache_response(b"screenshot", "prompt", "response", ttl=60)
+    assert get_cached_response(b"screenshot", "prompt") == "response"
+    # Different prompt for the same screenshot is a miss
+    assert get_cached_response(b"screenshot", "other prompt") is None
+    
+    cache_response(b"screenshot", "prompt", "response", ttl=0)
+    assert get_cached_response(b"screenshot", "prompt") is None
+
+
 @pytest.mark.asyncio
 async def test_list_files_pattern_matching(dagger_client):
     """
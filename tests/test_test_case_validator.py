@@ -35,12 +35,12 @@ async def test_validate_test_cases_success():
     
     vlm_client = Mock()
     
-    # Mock validate_game_with_test_case
-    with patch('src.validators.test_case_validator.validate_game_with_test_case',
-               AsyncMock(return_value=test_result)):
-        # Mock VLM validation to return success for both test cases
-        with patch('src.validators.test_case_validator.validate_test_case_with_vlm',
-                   side_effect=[(True, "Looks good"), (True, "Looks good")]):
+    # Mock the browser run
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result, test_result])):
+        # Mock batched VLM validation to return success for both test cases
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(True, "Looks good"), (True, "Looks good")]) as mock_vlm:
             result = await validate_test_cases(
                 workspace=workspace,
                 playwright_container=playwright_container,
@@ -55,6 +55,13 @@ async def test_validate_test_cases_success():
     assert result.error_message is None
     assert result.failures == []
     assert result.retry_count == 0
+    # The game is copied into the Playwright container once for all test cases
+    playwright_container.clone.return_value.reset.return_value.copy_directory.assert_called_once()
+    # Both screenshots are validated in a single VLM request, in order
+    mock_vlm.assert_called_once()
+    test_cases = mock_vlm.call_args.kwargs["test_cases"]
+    assert [tc["test_case_name"] for tc in test_cases] == ["test_case_1", "test_case_2"]
+    assert [tc["expected_output"] for tc in test_cases] == ["Score: 100", "Level complete"]
 
 
 @pytest.mark.asyncio
@@ -112,6 +119,37 @@ async def test_validate_test_cases_missing_expected_output():
     assert result.retry_count == 1
 
 
+@pytest.mark.asyncio
+async def test_validate_test_cases_broken_test_case_skips_browser_runs():
+    """Test that a broken test case fails validation before any test case runs."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_1.json", "test_case_2.json"])
+    
+    valid_test_case = json.dumps({"expectedOutput": "Test", "input": {}})
+    workspace.read_file = AsyncMock(side_effect=[valid_test_case, json.dumps({"input": {}})])
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
+    
+    playwright_container = Mock()
+    
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock()) as mock_validate:
+        with patch('src.validators.test_case_validator.save_test_case_error'):
+            result = await validate_test_cases(
+                workspace=workspace,
+                playwright_container=playwright_container,
+                vlm_client=Mock(),
+                session_id="test_session",
+                test_run_id="test_run",
+                retry_count=0
+            )
+    
+    # Assertions
+    assert result.passed is False
+    assert result.failures == ["test_case_2: Missing 'expectedOutput' field in test case JSON"]
+    mock_validate.assert_not_called()
+    playwright_container.clone.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_validate_test_cases_loading_error():
     """Test validation fails when test case loading has errors."""
@@ -133,8 +171,8 @@ async def test_validate_test_cases_loading_error():
     
     vlm_client = Mock()
     
-    with patch('src.validators.test_case_validator.validate_game_with_test_case',
-               AsyncMock(return_value=test_result)):
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result])):
         with patch('src.validators.test_case_validator.save_test_case_error'):
             result = await validate_test_cases(
                 workspace=workspace,
@@ -171,11 +209,11 @@ async def test_validate_test_cases_vlm_failure():
     
     vlm_client = Mock()
     
-    with patch('src.validators.test_case_validator.validate_game_with_test_case',
-               AsyncMock(return_value=test_result)):
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result])):
         # Mock VLM to return failure
-        with patch('src.validators.test_case_validator.validate_test_case_with_vlm',
-                   return_value=(False, "Score shows 0 instead of 100")):
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(False, "Score shows 0 instead of 100")]):
             with patch('src.validators.test_case_validator.save_test_case_error'):
                 result = await validate_test_cases(
                     workspace=workspace,
@@ -194,8 +232,8 @@ async def test_validate_test_cases_vlm_failure():
 
 
 @pytest.mark.asyncio
-async def test_validate_test_cases_stops_on_first_failure():
-    """Test that validation stops on the first failing test case."""
+async def test_validate_test_cases_browser_failure_skips_later_vlm():
+    """Test that a failed browser run is reported and later test cases skip VLM validation."""
     workspace = Mock()
     workspace.list_files = AsyncMock(return_value=["test_case_1.json", "test_case_2.json", "test_case_3.json"])
     
@@ -203,35 +241,210 @@ async def test_validate_test_cases_stops_on_first_failure():
     workspace.read_file = AsyncMock(return_value=test_case)
     workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
     
-    playwright_container = Mock()
-    playwright_container.reset = Mock()
-    playwright_container.copy_directory = Mock()
+    test_result = Mock()
+    test_result.screenshot_bytes = b"screenshot"
+    test_result.errors = []
+    
+    failed_result = Mock()
+    failed_result.screenshot_bytes = b"screenshot"
+    failed_result.errors = ["Failed"]
+    
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result, failed_result, failed_result])):
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(True, "OK")]) as mock_vlm:
+            with patch('src.validators.test_case_validator.save_test_case_error') as mock_save:
+                result = await validate_test_cases(
+                    workspace=workspace,
+                    playwright_container=Mock(),
+                    vlm_client=Mock(),
+                    session_id="test_session",
+                    test_run_id="test_run",
+                    retry_count=0
+                )
+    
+    # Assertions
+    assert result.passed is False
+    assert result.failures == ["test_case_2: Failed"]
+    # Only the reported failure is saved
+    mock_save.assert_called_once()
+    # Only the test case before the browser failure is sent to VLM
+    mock_vlm.assert_called_once()
+    assert [c["test_case_name"] for c in mock_vlm.call_args.kwargs["test_cases"]] == ["test_case_1"]
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_earlier_vlm_failure_beats_browser_failure():
+    """Test that a VLM rejection before a failed browser run is the failure reported."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_1.json", "test_case_2.json", "test_case_3.json"])
+    
+    test_case = json.dumps({"expectedOutput": "Test", "input": {}})
+    workspace.read_file = AsyncMock(return_value=test_case)
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
     
     test_result = Mock()
     test_result.screenshot_bytes = b"screenshot"
     test_result.errors = []
     
-    vlm_client = Mock()
+    failed_result = Mock()
+    failed_result.screenshot_bytes = b"screenshot"
+    failed_result.errors = ["Game crashed"]
     
-    with patch('src.validators.test_case_validator.validate_game_with_test_case',
-               AsyncMock(return_value=test_result)) as mock_validate:
-        # First test passes, second fails
-        with patch('src.validators.test_case_validator.validate_test_case_with_vlm',
-                   side_effect=[(True, "OK"), (False, "Failed")]):
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result, test_result, failed_result])):
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(False, "Wrong score"), (True, "OK")]) as mock_vlm:
             with patch('src.validators.test_case_validator.save_test_case_error'):
                 result = await validate_test_cases(
                     workspace=workspace,
-                    playwright_container=playwright_container,
-                    vlm_client=vlm_client,
+                    playwright_container=Mock(),
+                    vlm_client=Mock(),
                     session_id="test_session",
                     test_run_id="test_run",
                     retry_count=0
                 )
     
-    # Assertions
     assert result.passed is False
-    # Should only run 2 test cases (stop after second fails)
-    assert mock_validate.call_count == 2
+    assert result.failures == ["test_case_1 failed: Expected 'Test' but VLM observed 'Wrong score'"]
+    assert [c["test_case_name"] for c in mock_vlm.call_args.kwargs["test_cases"]] == ["test_case_1", "test_case_2"]
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_runs_all_in_one_browser_run():
+    """Test that all test cases are passed, in order, to a single browser run."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_1.json", "test_case_2.json", "test_case_3.json"])
+    
+    test_cases = [json.dumps({"expectedOutput": f"State {i}", "input": {}}) for i in (1, 2, 3)]
+    workspace.read_file = AsyncMock(side_effect=test_cases)
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
+    
+    playwright_container = Mock()
+    
+    test_result = Mock()
+    test_result.screenshot_bytes = b"screenshot"
+    test_result.errors = []
+    
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result] * 3)) as mock_validate:
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(True, "OK")] * 3):
+            result = await validate_test_cases(
+                workspace=workspace,
+                playwright_container=playwright_container,
+                vlm_client=Mock(),
+                session_id="test_session",
+                test_run_id="test_run",
+                retry_count=0
+            )
+    
+    assert result.passed is True
+    mock_validate.assert_awaited_once()
+    assert mock_validate.call_args.kwargs["test_cases"] == [
+        ("test_case_1", test_cases[0]), ("test_case_2", test_cases[1]), ("test_case_3", test_cases[2])
+    ]
+    assert mock_validate.call_args.kwargs["container"] is \
+        playwright_container.clone.return_value.reset.return_value.copy_directory.return_value
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_reports_earliest_failure():
+    """Test that the lowest-numbered failing test case is reported."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_1.json", "test_case_2.json"])
+    
+    test_case = json.dumps({"expectedOutput": "Test", "input": {}})
+    workspace.read_file = AsyncMock(return_value=test_case)
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
+    
+    playwright_container = Mock()
+    
+    results = []
+    for test_case_name in ("test_case_1", "test_case_2"):
+        result = Mock(screenshot_bytes=b"screenshot")
+        result.errors = [f"{test_case_name} crashed"]
+        results.append(result)
+    
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=results)):
+        with patch('src.validators.test_case_validator.save_test_case_error'):
+            result = await validate_test_cases(
+                workspace=workspace,
+                playwright_container=playwright_container,
+                vlm_client=Mock(),
+                session_id="test_session",
+                test_run_id="test_run",
+                retry_count=0
+            )
+    
+    assert result.passed is False
+    assert result.failures == ["test_case_1: test_case_1 crashed"]
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_reports_earliest_vlm_failure():
+    """Test that the lowest-numbered test case rejected by the batched VLM call is reported."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_1.json", "test_case_2.json", "test_case_3.json"])
+    
+    test_case = json.dumps({"expectedOutput": "Test", "input": {}})
+    workspace.read_file = AsyncMock(return_value=test_case)
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
+    
+    test_result = Mock()
+    test_result.screenshot_bytes = b"screenshot"
+    test_result.errors = []
+    
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result] * 3)):
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(True, "OK"), (False, "Wrong score"), (False, "Blank screen")]):
+            with patch('src.validators.test_case_validator.save_test_case_error') as mock_save:
+                result = await validate_test_cases(
+                    workspace=workspace,
+                    playwright_container=Mock(),
+                    vlm_client=Mock(),
+                    session_id="test_session",
+                    test_run_id="test_run",
+                    retry_count=0
+                )
+    
+    assert result.passed is False
+    assert result.failures == ["test_case_2 failed: Expected 'Test' but VLM observed 'Wrong score'"]
+    mock_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_sorted_numerically():
+    """Test that test cases run in numeric order, not lexicographic order."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_10.json", "test_case_2.json", "test_case_1.json"])
+    
+    test_case = json.dumps({"expectedOutput": "Test", "input": {}})
+    workspace.read_file = AsyncMock(return_value=test_case)
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
+    
+    test_result = Mock()
+    test_result.screenshot_bytes = b"screenshot"
+    test_result.errors = []
+    
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result] * 3)):
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(True, "OK")] * 3) as mock_vlm:
+            result = await validate_test_cases(
+                workspace=workspace,
+                playwright_container=Mock(),
+                vlm_client=Mock(),
+                session_id="test_session",
+                test_run_id="test_run",
+                retry_count=0
+            )
+    
+    assert result.passed is True
+    test_cases = mock_vlm.call_args.kwargs["test_cases"]
+    assert [tc["test_case_name"] for tc in test_cases] == ["test_case_1", "test_case_2", "test_case_10"]
 
 
 @pytest.mark.asyncio
@@ -258,10 +471,10 @@ async def test_validate_test_cases_max_5_test_cases():
     
     vlm_client = Mock()
     
-    with patch('src.validators.test_case_validator.validate_game_with_test_case',
-               AsyncMock(return_value=test_result)) as mock_validate:
-        with patch('src.validators.test_case_validator.validate_test_case_with_vlm',
-                   return_value=(True, "OK")):
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result] * 5)) as mock_validate:
+        with patch('src.validators.test_case_validator.validate_test_cases_with_vlm',
+                   return_value=[(True, "OK")] * 5):
             result = await validate_test_cases(
                 workspace=workspace,
                 playwright_container=playwright_container,
@@ -274,7 +487,7 @@ async def test_validate_test_cases_max_5_test_cases():
     # Assertions
     assert result.passed is True
     # Should only run 5 test cases (max limit)
-    assert mock_validate.call_count == 5
+    assert len(mock_validate.call_args.kwargs["test_cases"]) == 5
 
 
 @pytest.mark.asyncio
@@ -316,8 +529,8 @@ async def test_validate_test_cases_exception_handling():
     
     vlm_client = Mock()
     
-    # Mock validate_game_with_test_case to raise exception
-    with patch('src.validators.test_case_validator.validate_game_with_test_case',
+    # Mock the browser run to raise exception
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
                AsyncMock(side_effect=Exception("Container crashed"))):
         with patch('src.validators.test_case_validator.save_test_case_error'):
             result = await validate_test_cases(
@@ -335,3 +548,58 @@ async def test_validate_test_cases_exception_handling():
     assert "Container crashed" in result.error_message
     assert result.retry_count == 1
 
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_read_error():
+    """Test that a test case file that can't be read is reported as a failure."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_1.json", "test_case_2.json"])
+    
+    test_case = json.dumps({"expectedOutput": "Test", "input": {}})
+    workspace.read_file = AsyncMock(side_effect=[test_case, Exception("File not readable")])
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
+    
+    test_result = Mock()
+    test_result.screenshot_bytes = b"screenshot"
+    test_result.errors = []
+    
+    with patch('src.validators.test_case_validator.validate_game_with_test_cases',
+               AsyncMock(return_value=[test_result] * 2)):
+        with patch('src.validators.test_case_validator.save_test_case_error'):
+            result = await validate_test_cases(
+                workspace=workspace,
+                playwright_container=Mock(),
+                vlm_client=Mock(),
+                session_id="test_session",
+                test_run_id="test_run",
+                retry_count=0
+            )
+    
+    # Assertions
+    assert result.passed is False
+    assert result.failures == ["test_case_2: Error running test case: File not readable"]
+    # All files are read before any test case runs
+    assert workspace.read_file.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validate_test_cases_non_object_json():
+    """Test that a test case that is valid JSON but not an object is reported as a failure."""
+    workspace = Mock()
+    workspace.list_files = AsyncMock(return_value=["test_case_1.json"])
+    workspace.read_file = AsyncMock(return_value=json.dumps(["x"]))
+    workspace.container = Mock(return_value=Mock(directory=Mock(return_value=".")))
+    
+    with patch('src.validators.test_case_validator.save_test_case_error'):
+        result = await validate_test_cases(
+            workspace=workspace,
+            playwright_container=Mock(),
+            vlm_client=Mock(),
+            session_id="test_session",
+            test_run_id="test_run",
+            retry_count=0
+        )
+    
+    # Assertions
+    assert result.passed is False
+    assert result.failures == ["test_case_1: Error running test case: test case JSON must be an object"]
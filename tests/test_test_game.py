@@ -1,11 +1,17 @@
 """
 Unit tests for the test_game module.
 """
+import asyncio
 import pytest
 import pytest_asyncio
 import json
+import base64
 from unittest.mock import AsyncMock, MagicMock, Mock
-from test_game import GameTestResult, _parse_test_output, TEST_SCRIPT, validate_game_in_workspace
+from test_game import (
+    GameTestResult, _parse_test_output, _parse_test_outputs, TEST_SCRIPT,
+    TEST_SCRIPT_FILES, TEST_CASE_RUNNER, TEST_CASES_RUNNER,
+    validate_game_in_workspace, validate_game_with_test_cases
+)
 
 
 # Mark all tests in this module as unit tests
@@ -35,6 +41,11 @@ class TestGameTestResult:
         assert "GameTestResult" in repr_str
         assert "success=True" in repr_str
         assert "errors=[]" in repr_str
+    
+    def test_no_instance_dict(self):
+        """Test that GameTestResult uses slots instead of a per-instance __dict__."""
+        result = GameTestResult(success=True, errors=[])
+        assert not hasattr(result, "__dict__")
 
 
 class TestParseTestOutput:
@@ -128,6 +139,128 @@ __TEST_RESULT__{json.dumps(test_result)}__END__
         assert error_msg in result['errors']
 
 
+class TestParseTestOutputs:
+    """Tests for _parse_test_outputs function (batched test cases)."""
+    
+    def test_parse_multiple_results(self):
+        """Test parsing one result per test case."""
+        output = "\n".join(
+            "[test_case_%d] Page loaded\n__TEST_RESULT__%s__END__" % (i, json.dumps({"index": i, "success": True, "errors": []}))
+            for i in range(3)
+        )
+        results = _parse_test_outputs(output)
+        assert [r["index"] for r in results] == [0, 1, 2]
+    
+    def test_parse_ignores_unterminated_result(self):
+        """Test that a result cut off before its end marker is skipped."""
+        output = (
+            "__TEST_RESULT__" + json.dumps({"index": 0, "success": True, "errors": []}) + "__END__\n"
+            + '__TEST_RESULT__{"index": 1, "success": tr'
+        )
+        results = _parse_test_outputs(output)
+        assert [r["index"] for r in results] == [0]
+    
+    def test_parse_missing_markers(self):
+        """Test that missing markers give a single failed result."""
+        results = _parse_test_outputs("Node crashed")
+        assert len(results) == 1
+        assert results[0]["success"] is False
+        assert "no result markers found" in results[0]["errors"][0]
+
+
+class TestGameWithTestCases:
+    """Tests for validate_game_with_test_cases function."""
+    
+    def _setup_container(self, output):
+        """Mock a PlaywrightContainer whose run prints output."""
+        executed = MagicMock()
+        executed.stdout = AsyncMock(return_value=output)
+        executed.exit_code = AsyncMock(return_value=0)
+        
+        container = MagicMock()
+        container.container.return_value.with_env_variable.return_value.with_exec.return_value = executed
+        return container
+    
+    async def test_results_in_test_case_order(self):
+        """Test that results and screenshots are matched to test cases by index."""
+        output = "".join(
+            "__TEST_RESULT__" + json.dumps(r) + "__END__\n"
+            for r in [
+                {"index": 1, "success": True, "errors": ["Boom"], "console_logs": ["Boom"],
+                 "screenshot_b64": base64.b64encode(b"second").decode()},
+                {"index": 0, "success": True, "errors": [], "console_logs": [],
+                 "screenshot_b64": base64.b64encode(b"first").decode()},
+            ]
+        )
+        container = self._setup_container(output)
+        
+        results = await validate_game_with_test_cases(
+            container, [("test_case_1", '{"a": 1}'), ("test_case_2", '{"a": 2}')]
+        )
+        
+        assert [r.errors for r in results] == [[], ["Boom"]]
+        assert [r.screenshot_bytes for r in results] == [b"first", b"second"]
+        env_name, env_value = container.container.return_value.with_env_variable.call_args.args
+        assert env_name == "TEST_CASES_DATA"
+        assert json.loads(env_value) == [
+            {"name": "test_case_1", "json": '{"a": 1}'},
+            {"name": "test_case_2", "json": '{"a": 2}'},
+        ]
+        # Runs the script baked into the base container, no per-run script file
+        container.with_test_script.assert_not_called()
+        exec_args = container.container.return_value.with_env_variable.return_value.with_exec.call_args.args
+        assert exec_args[0] == ["node", "/opt/playwright/scripts/test-cases-runner.js"]
+    
+    async def test_run_failure_applies_to_every_test_case(self):
+        """Test that a result without an index is reported for every test case."""
+        output = "__TEST_RESULT__" + json.dumps({
+            "success": False, "errors": ["Test execution failed: no browser"], "console_logs": []
+        }) + "__END__"
+        container = self._setup_container(output)
+        
+        results = await validate_game_with_test_cases(
+            container, [("test_case_1", "{}"), ("test_case_2", "{}")]
+        )
+        
+        assert [r.errors for r in results] == [["Test execution failed: no browser"]] * 2
+        assert [r.screenshot_bytes for r in results] == [None, None]
+
+
+class TestBrowserRunLimit:
+    """Tests for the cap on concurrent browser runs."""
+    
+    def _container(self, name, tracker):
+        """Mock a PlaywrightContainer whose run records how many runs are in flight."""
+        async def stdout():
+            tracker["running"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["running"])
+            await asyncio.sleep(0.01)
+            tracker["running"] -= 1
+            return "__TEST_RESULT__" + json.dumps({
+                "success": True, "errors": [], "console_logs": [name],
+                "screenshot_b64": base64.b64encode(name.encode()).decode()
+            }) + "__END__"
+        
+        executed = MagicMock()
+        executed.stdout = AsyncMock(side_effect=stdout)
+        executed.exit_code = AsyncMock(return_value=0)
+        container = MagicMock()
+        container.container.return_value.with_exec.return_value = executed
+        return container
+    
+    async def test_concurrent_runs_capped_by_semaphore(self, monkeypatch):
+        """Test that concurrent validations share the semaphore and keep their own results."""
+        monkeypatch.setattr("test_game._browser_runs", asyncio.Semaphore(2))
+        tracker = {"running": 0, "peak": 0}
+        containers = [self._container(f"game{i}", tracker) for i in range(4)]
+        
+        results = await asyncio.gather(*(validate_game_in_workspace(c) for c in containers))
+        
+        assert [r.console_logs for r in results] == [["game0"], ["game1"], ["game2"], ["game3"]]
+        assert [r.screenshot_bytes for r in results] == [b"game0", b"game1", b"game2", b"game3"]
+        assert tracker["peak"] == 2
+
+
 class TestTestScript:
     """Tests for the JavaScript test script."""
     
@@ -151,6 +284,25 @@ class TestTestScript:
         """Test that TEST_SCRIPT outputs JSON result."""
         assert "JSON.stringify" in TEST_SCRIPT
         assert "console.log" in TEST_SCRIPT
+    
+    def test_script_caps_log_lists(self):
+        """Test that TEST_SCRIPT bounds its log lists and reports what it dropped."""
+        assert "MAX_LOG_ENTRIES" in TEST_SCRIPT
+        assert "consoleLogs.push(" not in TEST_SCRIPT
+        assert "truncated: truncated" in TEST_SCRIPT
+    
+    def test_script_waits_for_ready_signal(self):
+        """Test that TEST_SCRIPT waits for the game's ready flag instead of a fixed sleep."""
+        assert "window.__gameReady" in TEST_SCRIPT
+        assert "waitForTimeout" not in TEST_SCRIPT
+        assert "networkidle" not in TEST_SCRIPT
+    
+    def test_test_case_scripts_wait_for_game_ready_flag_only(self):
+        """Test that the test case runners don't treat a registered loadTestCase as the game being ready."""
+        for name in (TEST_CASE_RUNNER, TEST_CASES_RUNNER):
+            script = TEST_SCRIPT_FILES[name]
+            assert "window.__gameReady === true || performance.now() > readyTimeout" in script
+            assert "window.__gameReady === true || typeof window.loadTestCase" not in script
 
 
 class TestIntegration:
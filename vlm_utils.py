@@ -3,12 +3,24 @@ VLM validation utilities for playable testing and validation.
 """
 import re
 import logging
+from functools import lru_cache
 from typing import Tuple
 from pathlib import Path
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Tags the VLM is asked to answer with (compiled once, used for every response)
+_ANSWER_RE = re.compile(r'<answer>\s*(yes|no)\s*</answer>', re.IGNORECASE)
+_REASON_RE = re.compile(r'<reason>\s*(.*?)\s*</reason>', re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=128)
+def _get_template(template_str: str):
+    """Compile a Jinja2 prompt template once per distinct template string."""
+    from jinja2 import Template
+    return Template(template_str)
+
 
 def validate_playable_with_vlm(
     vlm_client,
@@ -54,8 +66,7 @@ def validate_playable_with_vlm(
             logger.info(f"Feedback mode: original='{original_prompt[:50]}...', feedback='{user_prompt[:50]}...'")
         
         # Render the template with context
-        from jinja2 import Template
-        template = Template(template_str)
+        template = _get_template(template_str)
         rendered_prompt = template.render(
             user_prompt=user_prompt,
             console_logs=formatted_logs,
@@ -65,12 +76,10 @@ def validate_playable_with_vlm(
         
         logger.debug(f"Rendered VLM prompt: {rendered_prompt[:200]}...")
         
-        # Call VLM with screenshot and rendered prompt
-        from PIL import Image
-        import io
-        image = Image.open(io.BytesIO(screenshot_bytes))
+        # Call VLM with screenshot and rendered prompt (raw PNG bytes, no decoding)
+        image_part = {"mime_type": "image/png", "data": screenshot_bytes}
         
-        response = vlm_client.model.generate_content([rendered_prompt, image])
+        response = vlm_client.model.generate_content([rendered_prompt, image_part])
         vlm_response = response.text
         
         # Parse response to extract answer and reason
@@ -278,19 +287,14 @@ def validate_test_case_with_vlm(
             _save_test_case_json(test_case_json, test_case_name, session_id, test_run_id)
             logger.info(f"Test case JSON for {test_case_name} saved to debug folder")
         
-        # Import Jinja2 Template here to render the prompt
-        from jinja2 import Template
-        
         # Render the prompt template
-        template = Template(template_str)
+        template = _get_template(template_str)
         rendered_prompt = template.render(expected_output=expected_output)
         
         logger.debug(f"Rendered test case prompt: {rendered_prompt[:200]}...")
         
-        # Convert bytes to PIL Image
-        from PIL import Image
-        import io
-        image = Image.open(io.BytesIO(screenshot_bytes))
+        # Pass the raw PNG bytes, no decoding
+        image_part = {"mime_type": "image/png", "data": screenshot_bytes}
         
         # Call VLM directly with the image and prompt
         # Note: We're not using validate_with_screenshot because we don't need console logs
@@ -299,7 +303,7 @@ def validate_test_case_with_vlm(
             # Create client if needed
             vlm_client = VLMClient()
         
-        response = vlm_client.model.generate_content([rendered_prompt, image])
+        response = vlm_client.model.generate_content([rendered_prompt, image_part])
         vlm_response = response.text
         
         logger.info("VLM test case validation response received")
@@ -332,7 +336,7 @@ def _parse_vlm_response(response_text: str) -> Tuple[bool, str]:
     """
     try:
         # Extract <answer> tag
-        answer_match = re.search(r'<answer>\s*(yes|no)\s*</answer>', response_text, re.IGNORECASE)
+        answer_match = _ANSWER_RE.search(response_text)
         if not answer_match:
             logger.warning(f"Could not find <answer> tag in VLM response: {response_text[:200]}...")
             return False, f"Invalid VLM response format: {response_text[:200]}..."
@@ -341,7 +345,7 @@ def _parse_vlm_response(response_text: str) -> Tuple[bool, str]:
         is_valid = answer == "yes"
         
         # Extract <reason> tag
-        reason_match = re.search(r'<reason>\s*(.*?)\s*</reason>', response_text, re.IGNORECASE | re.DOTALL)
+        reason_match = _REASON_RE.search(response_text)
         if reason_match:
             reason = reason_match.group(1).strip()
         else: